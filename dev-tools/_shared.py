@@ -0,0 +1,42 @@
+"""
+Shared helpers for the Obsidian Scribe development tools.
+"""
+
+import functools
+import sys
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+import yaml
+
+try:
+    # libyaml C bindings are several times faster than the pure-Python loader
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
+# Status markers for diagnostic output. Consoles that can't encode emoji
+# (e.g. cp1252 on Windows) get ASCII instead of a UnicodeEncodeError
+if 'utf' in (sys.stdout.encoding or '').lower():
+    OK, FAIL, WARN, INFO = "✅", "❌", "⚠️ ", "ℹ️ "
+else:
+    OK, FAIL, WARN, INFO = "[OK]", "[FAIL]", "[WARN]", "[INFO]"
+
+
+@functools.lru_cache(maxsize=1)
+def load_config(path: str = 'config.yaml') -> Optional[Dict[str, Any]]:
+    """
+    Load the YAML configuration file once per process.
+    
+    Args:
+        path: Path to the configuration file
+        
+    Returns:
+        Parsed configuration, or None if the file does not exist
+    """
+    config_path = Path(path)
+    if not config_path.exists():
+        return None
+        
+    with open(config_path, 'r', encoding='utf-8') as f:
+        return yaml.load(f, Loader=SafeLoader) or {}
@@ -5,6 +5,7 @@ Creates a test audio file and runs the application.
 """
 
 import os
+import shutil
 import sys
 import time
 import subprocess
@@ -16,37 +17,23 @@ load_dotenv()
 
 print("=== Obsidian Scribe Test Run ===\n")
 
-# Check if we have ffmpeg
-try:
-    subprocess.run(['ffmpeg', '-version'], capture_output=True, check=True)
+# Check if we have ffmpeg (PATH lookup, no process spawn)
+if shutil.which('ffmpeg'):
     print("✅ FFmpeg is available")
-except:
+else:
     print("❌ FFmpeg not found. Please install FFmpeg first.")
     print("   Download from: https://ffmpeg.org/download.html")
     sys.exit(1)
 
-# Create test audio file using ffmpeg (5 seconds of silence)
+# Copy the pre-generated test tone (5 seconds of 440Hz, 16kHz mono)
 print("\n1. Creating test audio file...")
+FIXTURE_PATH = Path(__file__).resolve().parents[2] / "tests" / "fixtures" / "sine_5s_16k_mono.wav"
 test_audio_path = Path("audio_input/test_audio.wav")
 test_audio_path.parent.mkdir(exist_ok=True)
 
-# Generate a 5-second test tone
-cmd = [
-    'ffmpeg', '-y',
-    '-f', 'lavfi',
-    '-i', 'sine=frequency=440:duration=5',
-    '-ar', '16000',
-    '-ac', '1',
-    str(test_audio_path)
-]
-
 try:
-    result = subprocess.run(cmd, capture_output=True, text=True)
-    if result.returncode == 0:
-        print(f"✅ Created test audio file: {test_audio_path}")
-    else:
-        print(f"❌ Failed to create test audio: {result.stderr}")
-        sys.exit(1)
+    shutil.copyfile(FIXTURE_PATH, test_audio_path)
+    print(f"✅ Created test audio file: {test_audio_path}")
 except Exception as e:
     print(f"❌ Error creating test audio: {e}")
     sys.exit(1)
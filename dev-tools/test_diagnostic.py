@@ -2,22 +2,24 @@
 """
 Diagnostic script to test Obsidian Scribe setup
 """
+import importlib.util
 import sys
 import os
-from pathlib import Path
 
 # Load environment variables from .env file
 from dotenv import load_dotenv
 load_dotenv()
 
+from _shared import FAIL, INFO, OK, WARN, load_config
+
 print("=== Obsidian Scribe Diagnostic Test ===\n")
 
 # 1. Check Python version
 print(f"1. Python Version: {sys.version}")
 if sys.version_info < (3, 8):
-    print("   ❌ ERROR: Python 3.8+ required")
+    print(f"   {FAIL} ERROR: Python 3.8+ required")
 else:
-    print("   ✅ Python version OK")
+    print(f"   {OK} Python version OK")
 
 # 2. Check required dependencies
 print("\n2. Checking Dependencies:")
@@ -34,37 +36,40 @@ required_deps = {
 }
 
 for module, package in required_deps.items():
+    # find_spec only locates the module; it doesn't run torch/pyannote's
+    # multi-second import just to confirm they're installed
     try:
-        __import__(module)
-        print(f"   ✅ {package} installed")
+        found = importlib.util.find_spec(module) is not None
     except ImportError:
-        print(f"   ❌ {package} NOT installed")
+        # Parent package of a dotted name is missing
+        found = False
+    if found:
+        print(f"   {OK} {package} installed")
+    else:
+        print(f"   {FAIL} {package} NOT installed")
         missing_deps.append(package)
 
 # 3. Check configuration
 print("\n3. Checking Configuration:")
-config_path = Path("config.yaml")
-if config_path.exists():
-    print("   ✅ config.yaml found")
+config = load_config()
+api_key_in_config = ''
+api_key_in_env = os.environ.get('OPENAI_API_KEY', '')
+if config is not None:
+    print(f"   {OK} config.yaml found")
     
     # Check API key
-    import yaml
-    with open(config_path, 'r') as f:
-        config = yaml.safe_load(f)
-    
     api_key_in_config = config.get('transcription', {}).get('api_key', '')
-    api_key_in_env = os.environ.get('OPENAI_API_KEY', '')
     
     if api_key_in_config or api_key_in_env:
-        print("   ✅ API key configured")
+        print(f"   {OK} API key configured")
     else:
-        print("   ❌ API key NOT configured (neither in config.yaml nor OPENAI_API_KEY env var)")
+        print(f"   {FAIL} API key NOT configured (neither in config.yaml nor OPENAI_API_KEY env var)")
 else:
-    print("   ❌ config.yaml NOT found")
+    print(f"   {FAIL} config.yaml NOT found")
 
 # 4. Check required directories
 print("\n4. Checking Directories:")
-if config_path.exists():
+if config is not None:
     dirs_to_check = [
         config['paths']['watch_folder'],
         config['paths']['output_folder'],
@@ -74,16 +79,25 @@ if config_path.exists():
         config['paths']['cache_folder']
     ]
     
-    for dir_path in dirs_to_check:
-        path = Path(dir_path)
-        if path.exists():
-            print(f"   ✅ {dir_path} exists")
+    # Read each parent directory once instead of stat-ing every path
+    normalized_dirs = [os.path.normpath(dir_path) for dir_path in dirs_to_check]
+    present_dirs = {}
+    for parent in {os.path.dirname(normalized) or '.' for normalized in normalized_dirs}:
+        try:
+            with os.scandir(parent) as entries:
+                present_dirs[parent] = {entry.name for entry in entries if entry.is_dir()}
+        except OSError:
+            present_dirs[parent] = set()
+    
+    for dir_path, normalized in zip(dirs_to_check, normalized_dirs):
+        parent = os.path.dirname(normalized) or '.'
+        if os.path.basename(normalized) in present_dirs[parent]:
+            print(f"   {OK} {dir_path} exists")
         else:
-            print(f"   ⚠️  {dir_path} does not exist (will be created on first run)")
+            print(f"   {WARN} {dir_path} does not exist (will be created on first run)")
 
 # 5. Test imports from src
 print("\n5. Testing Module Imports:")
-sys.path.insert(0, str(Path(__file__).parent))
 
 modules_to_test = [
     'src.config.manager',
@@ -97,9 +111,9 @@ import_errors = []
 for module in modules_to_test:
     try:
         __import__(module)
-        print(f"   ✅ {module} imported successfully")
+        print(f"   {OK} {module} imported successfully")
     except Exception as e:
-        print(f"   ❌ {module} import failed: {str(e)}")
+        print(f"   {FAIL} {module} import failed: {str(e)}")
         import_errors.append((module, str(e)))
 
 # 6. Summary
@@ -116,11 +130,11 @@ if import_errors:
     issues_found.append(f"Import errors in {len(import_errors)} modules")
 
 if issues_found:
-    print("\n❌ Issues Found:")
+    print(f"\n{FAIL} Issues Found:")
     for i, issue in enumerate(issues_found, 1):
         print(f"   {i}. {issue}")
     
-    print("\n📋 Recommended Actions:")
+    print(f"\n{INFO} Recommended Actions:")
     if missing_deps:
         print(f"   1. Install missing dependencies: pip install {' '.join(missing_deps)}")
     if not (api_key_in_config or api_key_in_env):
@@ -130,7 +144,7 @@ if issues_found:
     if import_errors:
         print("   3. Fix import errors (see details above)")
 else:
-    print("\n✅ All checks passed! The application should be ready to run.")
+    print(f"\n{OK} All checks passed! The application should be ready to run.")
     print("\nTo run a test:")
     print("   1. Place an audio file in ./audio_input/")
     print("   2. Run: python src/main.py")
\ No newline at end of file
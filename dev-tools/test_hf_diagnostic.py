@@ -6,8 +6,11 @@ Diagnostic script to test Hugging Face token and pyannote model access.
 import os
 import sys
 import requests
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+from _shared import FAIL, INFO, OK, WARN, load_config
+
 def test_hf_token():
     """Test if Hugging Face token is valid and has proper permissions."""
     print("=== Hugging Face Token Diagnostic ===\n")
@@ -23,9 +26,10 @@ def test_hf_token():
     
     # Check config file
     try:
-        import yaml
-        with open('config.yaml', 'r') as f:
-            config = yaml.safe_load(f)
+        config = load_config()
+        if config is None:
+            print("Could not read config.yaml: file not found")
+        else:
             config_token = config.get('diarization', {}).get('hf_token', '').strip()
             if config_token:
                 token_sources.append(('config.yaml', config_token))
@@ -33,11 +37,11 @@ def test_hf_token():
         print(f"Could not read config.yaml: {e}")
     
     if not token_sources:
-        print("❌ No Hugging Face token found!")
+        print(f"{FAIL} No Hugging Face token found!")
         print("   Please set HUGGING_FACE_TOKEN environment variable or add to config.yaml")
         return False
     
-    print(f"✅ Found {len(token_sources)} token source(s):")
+    print(f"{OK} Found {len(token_sources)} token source(s):")
     for source, token in token_sources:
         print(f"   - {source}: {token[:10]}...")
     
@@ -45,27 +49,25 @@ def test_hf_token():
     source, token = token_sources[0]
     print(f"\nTesting token from {source}...")
     
-    # Test token validity
-    headers = {"Authorization": f"Bearer {token}"}
+    # Test token validity. One session keeps the TLS connection to
+    # huggingface.co alive across all of the checks below
+    session = requests.Session()
+    session.headers.update({"Authorization": f"Bearer {token}"})
     
     # 1. Test basic token validity
-    print("\n1. Testing token validity...")
-    try:
-        response = requests.get(
-            "https://huggingface.co/api/whoami",
-            headers=headers,
-            timeout=10
-        )
-        if response.status_code == 200:
-            user_info = response.json()
-            print(f"   ✅ Token is valid! User: {user_info.get('name', 'Unknown')}")
-        else:
-            print(f"   ❌ Token validation failed: {response.status_code}")
-            print(f"   Response: {response.text}")
-            return False
-    except Exception as e:
-        print(f"   ❌ Failed to validate token: {e}")
-        return False
+    def check_token():
+        lines = ["\n1. Testing token validity..."]
+        try:
+            response = session.get("https://huggingface.co/api/whoami", timeout=10)
+            if response.status_code == 200:
+                user_info = response.json()
+                lines.append(f"   {OK} Token is valid! User: {user_info.get('name', 'Unknown')}")
+                return True, lines
+            lines.append(f"   {FAIL} Token validation failed: {response.status_code}")
+            lines.append(f"   Response: {response.text}")
+        except Exception as e:
+            lines.append(f"   {FAIL} Failed to validate token: {e}")
+        return False, lines
     
     # 2. Test access to pyannote models
     models_to_check = [
@@ -73,62 +75,84 @@ def test_hf_token():
         ("pyannote/segmentation", "https://huggingface.co/api/models/pyannote/segmentation")
     ]
     
-    all_models_accessible = True
-    
-    for model_name, model_url in models_to_check:
-        print(f"\n2. Testing access to {model_name}...")
+    def check_model_access(model_name, model_url):
+        lines = [f"\n2. Testing access to {model_name}..."]
         try:
-            response = requests.get(model_url, headers=headers, timeout=10)
+            response = session.get(model_url, timeout=10)
             if response.status_code == 200:
                 model_info = response.json()
                 if model_info.get('gated', False):
-                    print(f"   ⚠️  Model is gated (requires accepting conditions)")
+                    lines.append(f"   {WARN} Model is gated (requires accepting conditions)")
                     
                     # Check if user has access
                     if 'gated' in model_info and model_info['gated'] == 'auto':
-                        print(f"   ✅ You have access to {model_name}")
+                        lines.append(f"   {OK} You have access to {model_name}")
                     else:
-                        print(f"   ❌ You need to accept the model conditions at:")
-                        print(f"      https://hf.co/{model_name}")
-                        all_models_accessible = False
+                        lines.append(f"   {FAIL} You need to accept the model conditions at:")
+                        lines.append(f"      https://hf.co/{model_name}")
+                        return False, lines
                 else:
-                    print(f"   ✅ {model_name} is accessible")
+                    lines.append(f"   {OK} {model_name} is accessible")
             else:
-                print(f"   ❌ Cannot access {model_name}: {response.status_code}")
-                all_models_accessible = False
+                lines.append(f"   {FAIL} Cannot access {model_name}: {response.status_code}")
+                return False, lines
         except Exception as e:
-            print(f"   ❌ Failed to check {model_name} access: {e}")
-            all_models_accessible = False
-    
-    if not all_models_accessible:
-        return False
+            lines.append(f"   {FAIL} Failed to check {model_name} access: {e}")
+            return False, lines
+        return True, lines
     
     # 3. Test model file download for both models
-    print("\n3. Testing model file downloads...")
     test_files = [
         ("pyannote/speaker-diarization", "https://huggingface.co/pyannote/speaker-diarization/resolve/main/config.yaml"),
         ("pyannote/segmentation", "https://huggingface.co/pyannote/segmentation/resolve/main/config.yaml")
     ]
     
-    for model_name, test_file_url in test_files:
-        print(f"   Testing {model_name}...")
+    def check_file_download(model_name, test_file_url):
+        lines = [f"   Testing {model_name}..."]
         try:
-            response = requests.head(test_file_url, headers=headers, timeout=10)
+            response = session.head(test_file_url, timeout=10)
             if response.status_code == 200:
-                print(f"   ✅ Can download {model_name} files")
+                lines.append(f"   {OK} Can download {model_name} files")
+                return True, lines
             elif response.status_code == 401:
-                print(f"   ❌ Authentication failed for {model_name} - invalid token")
-                return False
+                lines.append(f"   {FAIL} Authentication failed for {model_name} - invalid token")
             elif response.status_code == 403:
-                print(f"   ❌ Access denied for {model_name} - you need to accept model conditions at:")
-                print(f"      https://hf.co/{model_name}")
-                return False
+                lines.append(f"   {FAIL} Access denied for {model_name} - you need to accept model conditions at:")
+                lines.append(f"      https://hf.co/{model_name}")
             else:
-                print(f"   ❌ Cannot download {model_name} files: {response.status_code}")
-                return False
+                lines.append(f"   {FAIL} Cannot download {model_name} files: {response.status_code}")
         except Exception as e:
-            print(f"   ❌ Failed to test {model_name} file download: {e}")
+            lines.append(f"   {FAIL} Failed to test {model_name} file download: {e}")
+        return False, lines
+    
+    # Check the token on its own first; with a bad token every model probe
+    # would fail too, so none of them are sent
+    token_valid, lines = check_token()
+    print("\n".join(lines))
+    if not token_valid:
+        return False
+    
+    # Fire the four model probes in one burst; results are reported in the
+    # original order so the output reads the same as a sequential run
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        access_futures = [executor.submit(check_model_access, *model) for model in models_to_check]
+        download_futures = [executor.submit(check_file_download, *test) for test in test_files]
+        
+        all_models_accessible = True
+        for future in access_futures:
+            accessible, lines = future.result()
+            print("\n".join(lines))
+            all_models_accessible = all_models_accessible and accessible
+        
+        if not all_models_accessible:
             return False
+        
+        print("\n3. Testing model file downloads...")
+        for future in download_futures:
+            downloadable, lines = future.result()
+            print("\n".join(lines))
+            if not downloadable:
+                return False
     
     # 4. Check cache directory
     print("\n4. Checking cache directory...")
@@ -137,20 +161,26 @@ def test_hf_token():
         cache_dir = Path(huggingface_hub.constants.HUGGINGFACE_HUB_CACHE)
         print(f"   Cache directory: {cache_dir}")
         if cache_dir.exists():
-            print(f"   ✅ Cache directory exists")
-            # Check for pyannote models in cache
-            pyannote_models = list(cache_dir.glob("**/pyannote*"))
+            print(f"   {OK} Cache directory exists")
+            # Check for pyannote models in cache (hub layout: models--{org}--{name})
+            pyannote_models = [
+                path for path in (
+                    cache_dir / f"models--pyannote--{model}"
+                    for model in ("speaker-diarization", "segmentation")
+                )
+                if path.exists()
+            ]
             if pyannote_models:
-                print(f"   ✅ Found {len(pyannote_models)} pyannote model(s) in cache")
+                print(f"   {OK} Found {len(pyannote_models)} pyannote model(s) in cache")
             else:
-                print("   ℹ️  No pyannote models in cache (will download on first use)")
+                print(f"   {INFO} No pyannote models in cache (will download on first use)")
         else:
-            print("   ⚠️  Cache directory doesn't exist (will be created on first use)")
+            print(f"   {WARN} Cache directory doesn't exist (will be created on first use)")
     except Exception as e:
-        print(f"   ❌ Failed to check cache: {e}")
+        print(f"   {FAIL} Failed to check cache: {e}")
     
     print("\n" + "="*50)
-    print("✅ All checks passed! Your Hugging Face token should work.")
+    print(f"{OK} All checks passed! Your Hugging Face token should work.")
     print("\nIf you still have issues, make sure you:")
     print("1. Have accepted the conditions for BOTH models:")
     print("   - https://hf.co/pyannote/speaker-diarization")
@@ -165,20 +195,20 @@ def test_pyannote_import():
     print("\n=== Testing pyannote.audio Import ===\n")
     try:
         import pyannote.audio
-        print("✅ pyannote.audio imported successfully")
+        print(f"{OK} pyannote.audio imported successfully")
         print(f"   Version: {pyannote.audio.__version__}")
         
         # Try importing Pipeline
         from pyannote.audio import Pipeline
-        print("✅ Pipeline imported successfully")
+        print(f"{OK} Pipeline imported successfully")
         
         return True
     except ImportError as e:
-        print(f"❌ Failed to import pyannote.audio: {e}")
+        print(f"{FAIL} Failed to import pyannote.audio: {e}")
         print("\nTry installing with: pip install pyannote.audio")
         return False
     except Exception as e:
-        print(f"❌ Unexpected error: {e}")
+        print(f"{FAIL} Unexpected error: {e}")
         return False
 
 def main():
@@ -192,10 +222,10 @@ def main():
     
     # Test HF token
     if not test_hf_token():
-        print("\n❌ Diagnostic failed. Please fix the issues above.")
+        print(f"\n{FAIL} Diagnostic failed. Please fix the issues above.")
         sys.exit(1)
     
-    print("\n✅ All diagnostics passed!")
+    print(f"\n{OK} All diagnostics passed!")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -25,6 +25,25 @@ def read_requirements(filename='requirements.txt'):
             return [line.strip() for line in f if line.strip() and not line.startswith('#')]
     return []
 
+# Optionally compile hot utility modules to C extensions with mypyc
+def compiled_extensions():
+    """Return mypyc extension modules when OBSIDIAN_SCRIBE_COMPILE=1."""
+    if os.environ.get('OBSIDIAN_SCRIBE_COMPILE') != '1':
+        return []
+    try:
+        from mypyc.build import mypycify
+    except ImportError:
+        print('mypy is not installed; building without compiled extensions')
+        return []
+    # The package is installed from src/ (package_dir below), so module names
+    # must be resolved relative to src/: utils.helpers, not src.utils.helpers.
+    # The strict [tool.mypy] settings are for linting, not for this build
+    os.environ['MYPYPATH'] = 'src'
+    return mypycify([
+        '--config-file=', '--explicit-package-bases', '--follow-imports=silent',
+        'src/utils/helpers.py',
+    ])
+
 # Package metadata
 setup(
     name='obsidian-scribe',
@@ -41,6 +60,9 @@ setup(
     packages=find_packages(where='src'),
     package_dir={'': 'src'},
     
+    # Compiled extensions (opt-in, see compiled_extensions)
+    ext_modules=compiled_extensions(),
+    
     # Include package data
     include_package_data=True,
     package_data={
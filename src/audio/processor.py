@@ -5,13 +5,16 @@ Manages the processing pipeline for audio files including diarization,
 transcription, and output generation.
 """
 
+import heapq
 import logging
+import os
 import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from queue import Queue, Empty
-from threading import Thread, Event, Lock
-from typing import Dict, List, Optional, Tuple
+from threading import Thread, Event, Lock, BoundedSemaphore, Condition, local
+from typing import Deque, Dict, Iterable, List, Optional, Tuple
 
 from ..storage.file_manager import FileManager
 from ..storage.archive import ArchiveManager
@@ -63,24 +66,45 @@ class AudioProcessor:
         self.chunker = AudioChunker(config)
         self.transcript_generator = TranscriptGenerator(config)
         
-        # Processing queue
-        self.process_queue: Queue = Queue()
-        self.failed_queue: Queue = Queue()
+        # Processing queue of (file_path, file_info). A plain deque guarded by
+        # a condition; the dispatcher is the only consumer and task tracking
+        # isn't needed. file_info is the stat taken when the file was queued
+        self.process_queue: Deque[Tuple[str, Dict]] = deque()
+        self._queue_ready = Condition()
+        
+        # Failed files waiting for retry, as a min-heap of
+        # (ready_at, file_path, retry_count) keyed on monotonic time
+        self._retry_heap: List[Tuple[float, str, int]] = []
+        self._retry_ready = Condition()
         
         # Threading components
+        self.concurrent_files = max(1, self.processing_config.get('concurrent_files', 1))
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._worker_slots = BoundedSemaphore(self.concurrent_files)
+        # Diarization is GPU/CPU bound, so only a few files run it at once;
+        # the other workers keep converting and transcribing (network bound)
+        # in the meantime, pipelining files through the stages
+        self._diarize_slots = BoundedSemaphore(
+            max(1, self.processing_config.get('diarize_workers', 1))
+        )
         self._processing_thread: Optional[Thread] = None
         self._retry_thread: Optional[Thread] = None
         self._stop_event = Event()
         self._running = False
         self._processing_lock = Lock()
         
-        # Statistics
-        self.stats = {
-            'processed': 0,
-            'failed': 0,
-            'retried': 0,
-            'total_time': 0.0
-        }
+        # Files larger than this are chunked before transcription
+        self.chunk_size_mb = self.config.get('transcription', {}).get('chunk_size_mb', 24)
+        self._chunk_threshold_bytes = int(self.chunk_size_mb * 1024 * 1024)
+        
+        # needs_conversion() results by file path, with the (mtime, size) they
+        # were probed at, so a retried file isn't probed again
+        self._conversion_checks: Dict[str, Tuple[float, int, bool]] = {}
+        
+        # Statistics. Each worker thread counts into its own shard so the
+        # per-file completion path never takes a lock; get_stats() sums them
+        self._local = local()
+        self._stats_shards: List[Dict] = []
         
     def start(self):
         """Start the audio processor."""
@@ -92,7 +116,14 @@ class AudioProcessor:
         self._running = True
         self._stop_event.clear()
         
-        # Start processing thread
+        # Worker pool for concurrent file processing
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.concurrent_files,
+            thread_name_prefix='scribe'
+        )
+        self.logger.info(f"Processing up to {self.concurrent_files} file(s) concurrently")
+        
+        # Start dispatcher thread
         self._processing_thread = Thread(target=self._process_loop, daemon=True)
         self._processing_thread.start()
         
@@ -112,6 +143,12 @@ class AudioProcessor:
         self._running = False
         self._stop_event.set()
         
+        # Wake the dispatcher and retry threads so they see the stop
+        with self._queue_ready:
+            self._queue_ready.notify_all()
+        with self._retry_ready:
+            self._retry_ready.notify_all()
+        
         # Wait for threads to finish
         if self._processing_thread:
             self._processing_thread.join(timeout=5)
@@ -121,8 +158,14 @@ class AudioProcessor:
             self._retry_thread.join(timeout=5)
             self._retry_thread = None
             
+        # Let in-flight files finish
+        if self._executor:
+            self.logger.info("Waiting for in-flight files to finish...")
+            self._executor.shutdown(wait=True)
+            self._executor = None
+            
         self.logger.info("Audio processor stopped")
-        self.logger.info(f"Processing statistics: {self.stats}")
+        self.logger.info(f"Processing statistics: {self.get_stats()}")
         
     def add_file(self, file_path: str):
         """
@@ -131,122 +174,228 @@ class AudioProcessor:
         Args:
             file_path: Path to the audio file
         """
-        # Validate file exists
-        if not Path(file_path).exists():
-            self.logger.error(f"File does not exist: {file_path}")
+        self.add_files([file_path])
+        
+    def add_files(self, file_paths: List[str]):
+        """
+        Add several files to the processing queue under a single lock.
+        
+        Args:
+            file_paths: Paths to the audio files
+        """
+        existing = []
+        for file_path in file_paths:
+            # Validate file exists. The same stat is passed on to processing
+            file_info = self.file_manager.get_file_info(file_path)
+            if not file_info:
+                self.logger.error(f"File does not exist: {file_path}")
+                continue
+            self.logger.info(f"Adding file to processing queue: {file_path}")
+            existing.append((file_path, file_info))
+            
+        if not existing:
             return
             
         # Add to queue
-        self.logger.info(f"Adding file to processing queue: {file_path}")
-        self.process_queue.put(file_path)
+        with self._queue_ready:
+            self.process_queue.extend(existing)
+            self._queue_ready.notify()
         
     def _process_loop(self):
-        """Main processing loop."""
+        """Dispatch queued files to the worker pool."""
         while self._running:
             try:
-                # Get file from queue with timeout
-                try:
-                    file_path = self.process_queue.get(timeout=1.0)
-                except Empty:
+                # Sleep until a file is queued or the processor is stopped;
+                # add_files() and stop() both notify, so no timeout is needed
+                with self._queue_ready:
+                    self._queue_ready.wait_for(lambda: self.process_queue or not self._running)
+                    if not self.process_queue:
+                        continue
+                        
+                # Wait for a free worker so files stay in the queue until
+                # they can actually be processed. The slot is only taken once
+                # there is work, so an idle dispatcher doesn't hold one that
+                # a due retry needs
+                if not self._worker_slots.acquire(timeout=1.0):
                     continue
                     
-                if file_path and Path(file_path).exists():
-                    # Process the file
-                    result = self._process_file(file_path)
+                with self._queue_ready:
+                    if not self.process_queue:
+                        self._worker_slots.release()
+                        continue
+                    file_path, file_info = self.process_queue.popleft()
+                    
+                try:
+                    future = self._executor.submit(self._process_and_record, file_path, file_info)
+                except Exception:
+                    # e.g. the pool was shut down; keep the file and the slot
+                    with self._queue_ready:
+                        self.process_queue.appendleft((file_path, file_info))
+                    self._worker_slots.release()
+                    raise
+                future.add_done_callback(lambda _: self._worker_slots.release())
                     
-                    # Update statistics
-                    with self._processing_lock:
-                        if result.success:
-                            self.stats['processed'] += 1
-                        else:
-                            self.stats['failed'] += 1
-                            # Add to failed queue for retry
-                            if self.processing_config.get('retry_failed', True):
-                                self.failed_queue.put((file_path, 1, time.time()))
-                                
-                        self.stats['total_time'] += result.processing_time
-                        
             except Exception as e:
                 self.logger.error(f"Error in processing loop: {e}", exc_info=True)
-                time.sleep(1)
+                self._stop_event.wait(1)
                 
+    def _process_and_record(self, file_path: str, file_info: Dict):
+        """
+        Process a file on a worker thread and record the outcome.
+        
+        Args:
+            file_path: Path to the audio file
+            file_info: Result of get_file_info() taken when the file was queued
+        """
+        result = self._process_file(file_path, file_info)
+        
+        # Update statistics
+        stats = self._thread_stats()
+        stats['processed' if result.success else 'failed'] += 1
+        stats['total_time'] += result.processing_time
+            
+        # Add to failed queue for retry
+        if not result.success and self.processing_config.get('retry_failed', True):
+            self._schedule_retry(file_path, 1)
+                
+    def _schedule_retry(self, file_path: str, retry_count: int):
+        """
+        Schedule a failed file for another attempt after the retry delay.
+        
+        Args:
+            file_path: Path to the audio file
+            retry_count: Number of attempts made so far
+        """
+        retry_delay = self.processing_config.get('retry_delay', 60)
+        with self._retry_ready:
+            heapq.heappush(self._retry_heap, (time.monotonic() + retry_delay, file_path, retry_count))
+            self._retry_ready.notify()
+            
     def _retry_loop(self):
         """Retry loop for failed files."""
-        retry_delay = self.processing_config.get('retry_delay', 60)
         max_retries = self.processing_config.get('max_retries', 3)
         
         while self._running:
             try:
-                # Check failed queue
-                try:
-                    file_path, retry_count, last_attempt = self.failed_queue.get(timeout=5.0)
-                except Empty:
-                    continue
+                # Sleep until the earliest retry is due (or a new one arrives)
+                with self._retry_ready:
+                    if not self._running:
+                        break
+                    if not self._retry_heap:
+                        self._retry_ready.wait()
+                        continue
+                        
+                    wait_time = self._retry_heap[0][0] - time.monotonic()
+                    if wait_time > 0:
+                        self._retry_ready.wait(timeout=wait_time)
+                        continue
+                        
+                    _, file_path, retry_count = heapq.heappop(self._retry_heap)
                     
-                # Check if enough time has passed
-                if time.time() - last_attempt < retry_delay:
-                    # Put it back in the queue
-                    self.failed_queue.put((file_path, retry_count, last_attempt))
-                    time.sleep(1)
-                    continue
+                # Wait for a free worker like the dispatcher does, so retries
+                # never run more than concurrent_files files at once
+                acquired = False
+                while self._running and not acquired:
+                    acquired = self._worker_slots.acquire(timeout=1.0)
+                if not acquired:
+                    break
                     
                 # Check if file still exists
-                if not Path(file_path).exists():
+                file_info = self.file_manager.get_file_info(file_path)
+                if not file_info:
                     self.logger.warning(f"File no longer exists for retry: {file_path}")
+                    self._conversion_checks.pop(file_path, None)
+                    self._worker_slots.release()
                     continue
                     
-                # Retry processing
+                # Retry processing on the worker pool
                 self.logger.info(f"Retrying file (attempt {retry_count + 1}): {file_path}")
-                result = self._process_file(file_path)
-                
-                with self._processing_lock:
-                    self.stats['retried'] += 1
-                    
-                if result.success:
-                    self.stats['processed'] += 1
-                    self.logger.info(f"Retry successful: {file_path}")
-                else:
-                    # Check if we should retry again
-                    if retry_count < max_retries:
-                        self.failed_queue.put((file_path, retry_count + 1, time.time()))
-                    else:
-                        self.logger.error(f"Max retries reached for: {file_path}")
-                        # Move to failed folder
-                        self._move_to_failed(file_path)
+                try:
+                    future = self._executor.submit(self._retry_and_record, file_path, file_info, retry_count, max_retries)
+                except Exception:
+                    # e.g. the pool was shut down; don't leak the slot
+                    self._worker_slots.release()
+                    raise
+                future.add_done_callback(lambda _: self._worker_slots.release())
                         
             except Exception as e:
                 self.logger.error(f"Error in retry loop: {e}", exc_info=True)
-                time.sleep(5)
+                self._stop_event.wait(5)
                 
-    def _process_file(self, file_path: str) -> ProcessingResult:
+    def _retry_and_record(self, file_path: str, file_info: Dict, retry_count: int, max_retries: int):
+        """
+        Retry a failed file on a worker thread and record the outcome.
+        
+        Args:
+            file_path: Path to the audio file
+            file_info: Result of get_file_info() taken when the retry was due
+            retry_count: Number of attempts made so far
+            max_retries: Maximum number of retry attempts
+        """
+        result = self._process_file(file_path, file_info)
+        
+        # Update statistics
+        stats = self._thread_stats()
+        stats['retried'] += 1
+        if result.success:
+            stats['processed'] += 1
+        stats['total_time'] += result.processing_time
+            
+        if result.success:
+            self.logger.info(f"Retry successful: {file_path}")
+        elif retry_count < max_retries:
+            # Queue for another attempt
+            self._schedule_retry(file_path, retry_count + 1)
+        else:
+            self.logger.error(f"Max retries reached for: {file_path}")
+            # Move to failed folder
+            self._move_to_failed(file_path)
+                
+    def _process_file(self, file_path: str, file_info: Optional[Dict] = None) -> ProcessingResult:
         """
         Process a single audio file.
         
         Args:
             file_path: Path to the audio file
+            file_info: Result of get_file_info() for this file, if the
+                caller already has it (avoids another stat)
             
         Returns:
             ProcessingResult object
         """
         start_time = time.time()
         result = ProcessingResult(file_path)
+        converted_path = file_path
+        chunks = None
+        # Chunks handed to transcription so far. A chunker generator's
+        # paths are only known once consumed, so they are recorded here
+        chunk_paths: List[str] = []
         
         try:
             self.logger.info(f"Processing file: {file_path}")
             
+            # Stat the file once and reuse the result for validation,
+            # chunking decisions and logging
+            if file_info is None:
+                file_info = self.file_manager.get_file_info(file_path)
+            
             # Validate audio file
-            if not self.file_manager.validate_audio_file(file_path):
+            if not self.file_manager.validate_audio_file(file_path, file_info):
                 raise ValueError("Invalid audio file format")
                 
-            # Get file info
-            file_info = self.file_manager.get_file_info(file_path)
             self.logger.info(f"File: {file_info['name']}, Size: {file_info['size_mb']:.2f} MB")
             
             # Convert audio if needed
-            converted_path = self._prepare_audio(file_path)
+            converted_path = self._prepare_audio(file_path, file_info)
             
             # Check if file needs chunking
-            chunks = self._chunk_if_needed(converted_path, file_info)
+            # Only a converted file needs a fresh stat; otherwise the size
+            # from file_info is still current
+            if converted_path == file_path:
+                size_bytes = file_info['size']
+            else:
+                size_bytes = os.stat(converted_path).st_size
+            chunks = self._chunk_if_needed(converted_path, size_bytes)
             
             # Check if diarization is enabled
             diarization_enabled = self.config.get('diarization', {}).get('enabled', True)
@@ -257,7 +406,8 @@ class AudioProcessor:
                 def diarization_progress(message: str, percentage: float):
                     self.logger.info(f"Diarization progress: {message} ({percentage:.0f}%)")
                 
-                result.diarization_result = self.diarizer.diarize(converted_path, progress_callback=diarization_progress)
+                with self._diarize_slots:
+                    result.diarization_result = self.diarizer.diarize(converted_path, progress_callback=diarization_progress)
             else:
                 # Calculate time savings
                 file_size_mb = file_info.get('size_mb', 0)
@@ -269,9 +419,9 @@ class AudioProcessor:
             
             # Perform transcription
             self.logger.info("Performing transcription...")
-            if chunks:
+            if chunks is not None:
                 # Transcribe chunks and combine
-                result.transcription_result = self._transcribe_chunks(chunks)
+                result.transcription_result = self._transcribe_chunks(chunks, chunk_paths)
             else:
                 # Transcribe whole file
                 result.transcription_result = self.transcriber.transcribe(converted_path)
@@ -285,22 +435,12 @@ class AudioProcessor:
             )
             result.transcript_path = transcript_path
             
-            # Archive the original file
+            # Move the original file from the input folder into the archive
             self.logger.info("Archiving processed file...")
-            self.archive_manager.archive_file(file_path)
-            
-            # Remove original file from input folder after successful archiving
-            self.logger.info(f"Removing original file from input folder: {file_path}")
-            self.file_manager.delete_file(file_path)
-            
-            # Clean up temporary files
-            if converted_path != file_path:
-                self.file_manager.delete_file(converted_path)
-            if chunks:
-                for chunk in chunks:
-                    self.file_manager.delete_file(chunk)
+            self.archive_manager.archive_file(file_path, move=True)
             
             # Mark as successful
+            self._conversion_checks.pop(file_path, None)
             result.success = True
             self.logger.info(f"Successfully processed: {file_info['name']}")
             
@@ -309,7 +449,18 @@ class AudioProcessor:
             result.error_message = str(e)
             result.success = False
             
-            # Clear the file from processing set if file watcher is available
+        finally:
+            # Clean up temporary files, including after a failed attempt so
+            # intermediates don't accumulate in the temp folder between retries
+            # A chunk list is known in full even if transcription never ran
+            if isinstance(chunks, list):
+                chunk_paths = chunks
+            self._cleanup_temp_files(file_path, converted_path, chunk_paths)
+            
+            # Clear the file from the watcher's processing set and queue
+            # manager if a file watcher is available. Done on success too,
+            # so neither grows with every file processed and a new file with
+            # the same name is picked up
             if hasattr(self, 'file_watcher') and self.file_watcher:
                 self.file_watcher.clear_processing_file(file_path)
                 self.logger.debug(f"Cleared {file_path} from processing set")
@@ -320,68 +471,151 @@ class AudioProcessor:
         
         return result
         
-    def _prepare_audio(self, file_path: str) -> str:
+    def _cleanup_temp_files(self, file_path: str, converted_path: str, chunks: List[str]):
+        """
+        Remove intermediate files created while processing a file.
+        
+        Args:
+            file_path: Path to the original audio file
+            converted_path: Path to the converted audio file
+            chunks: Chunk paths created for the file, if it was chunked
+        """
+        temp_files = list(chunks)
+        if converted_path != file_path:
+            temp_files.append(converted_path)
+            
+        # Unlink directly rather than through FileManager.delete_file, which
+        # builds a Path and logs for every chunk of a long recording
+        removed = 0
+        for temp_file in temp_files:
+            try:
+                os.unlink(temp_file)
+                removed += 1
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                self.logger.warning(f"Could not remove temporary file {temp_file}: {e}")
+                
+        if removed:
+            self.logger.debug(f"Removed {removed} temporary file(s) for {file_path}")
+            
+    def _prepare_audio(self, file_path: str, file_info: Dict) -> str:
         """
         Prepare audio file for processing (convert if needed).
         
         Args:
             file_path: Path to the audio file
+            file_info: File information dictionary
             
         Returns:
             Path to prepared audio file
         """
-        # Check if conversion is needed
-        if self.converter.needs_conversion(file_path):
+        # Check if conversion is needed, reusing an earlier probe of the
+        # same file contents
+        identity = (file_info['modified'], file_info['size'])
+        cached = self._conversion_checks.get(file_path)
+        if cached is not None and cached[:2] == identity:
+            needs_conversion = cached[2]
+        else:
+            needs_conversion = self.converter.needs_conversion(file_path)
+            self._conversion_checks[file_path] = (*identity, needs_conversion)
+            
+        if needs_conversion:
             self.logger.info("Converting audio format...")
             return self.converter.convert(file_path)
         return file_path
         
-    def _chunk_if_needed(self, file_path: str, file_info: Dict) -> Optional[List[str]]:
+    def _chunk_if_needed(self, file_path: str, size_bytes: int) -> Optional[Iterable[str]]:
         """
         Check if file needs chunking and chunk if necessary.
         
         Args:
             file_path: Path to the audio file
-            file_info: File information dictionary
+            size_bytes: Size of the audio file in bytes
             
         Returns:
-            List of chunk paths if chunked, None otherwise
+            Chunk paths (a list, or a generator producing them) if
+            chunked, None otherwise
         """
-        max_size_mb = self.config.get('transcription', {}).get('chunk_size_mb', 24)
-        
-        if file_info['size_mb'] > max_size_mb:
-            self.logger.info(f"File size ({file_info['size_mb']:.2f} MB) exceeds limit ({max_size_mb} MB), chunking...")
+        if size_bytes > self._chunk_threshold_bytes:
+            size_mb = size_bytes / (1024 * 1024)
+            self.logger.info(f"File size ({size_mb:.2f} MB) exceeds limit ({self.chunk_size_mb} MB), chunking...")
             return self.chunker.chunk_audio(file_path)
             
         return None
         
-    def _transcribe_chunks(self, chunks: List[str]) -> Dict:
+    def _transcribe_chunks(self, chunks: Iterable[str], chunk_paths: List[str]) -> Dict:
         """
         Transcribe multiple audio chunks and combine results.
         
         Args:
-            chunks: List of chunk file paths
+            chunks: Chunk file paths, in order. Each chunk is submitted as
+                soon as it is produced, so this may be a generator
+            chunk_paths: List each chunk path is appended to as it is taken
+                from chunks, so the caller can clean up after a failure
             
         Returns:
             Combined transcription result
         """
-        self.logger.info(f"Transcribing {len(chunks)} chunks...")
+        self.logger.info("Transcribing chunks...")
         
         all_segments = []
         full_text = []
+        language = 'en'
+        offset = 0.0
         
-        for i, chunk in enumerate(chunks):
-            self.logger.info(f"Transcribing chunk {i+1}/{len(chunks)}...")
-            chunk_result = self.transcriber.transcribe(chunk)
-            
-            if chunk_result and 'segments' in chunk_result:
-                all_segments.extend(chunk_result['segments'])
-                full_text.append(chunk_result.get('text', ''))
+        # Each chunk is an independent API request, so send several at once;
+        # results are still collected in chunk order
+        workers = max(1, self.processing_config.get('transcribe_workers', 4))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='scribe-chunk') as executor:
+            futures = []
+            try:
+                for chunk in chunks:
+                    chunk_paths.append(chunk)
+                    futures.append((chunk, executor.submit(self.transcriber.transcribe, chunk)))
+                    
+                for i, (chunk, future) in enumerate(futures):
+                    chunk_result = future.result()
+                    self.logger.info(f"Transcribed chunk {i+1}/{len(futures)}")
+                    
+                    # Remove each chunk once it is transcribed, so only pending
+                    # chunks take up space in the temp folder; anything left
+                    # after a failure is removed by _cleanup_temp_files()
+                    try:
+                        os.unlink(chunk)
+                    except OSError:
+                        pass
+                        
+                    if not chunk_result or 'segments' not in chunk_result:
+                        continue
+                        
+                    segments = chunk_result['segments']
+                    language = chunk_result.get('language', language)
+                    
+                    # Chunks are transcribed independently and their timestamps
+                    # restart at zero; shift them to follow the previous chunk.
+                    # The result is only used here, so update it in place rather
+                    # than copying every segment of a long recording
+                    if segments and segments[0].get('start', 0.0) < offset:
+                        for segment in segments:
+                            segment['start'] = segment.get('start', 0.0) + offset
+                            segment['end'] = segment.get('end', 0.0) + offset
+                            
+                    if segments:
+                        offset = max(offset, segments[-1].get('end', offset))
+                    all_segments.extend(segments)
+                    full_text.append(chunk_result.get('text', ''))
+                    
+            except BaseException:
+                # The file has failed; don't spend requests on its other chunks
+                for _, future in futures:
+                    future.cancel()
+                raise
                 
         return {
             'text': ' '.join(full_text),
             'segments': all_segments,
-            'language': chunk_result.get('language', 'en') if chunks else 'en'
+            'language': language
         }
         
     def _move_to_failed(self, file_path: str):
@@ -391,6 +625,7 @@ class AudioProcessor:
         Args:
             file_path: Path to the audio file
         """
+        self._conversion_checks.pop(file_path, None)
         failed_folder = Path(self.paths.get('audio_folder', './Audio')) / 'Failed'
         self.file_manager.ensure_directory(failed_folder)
         
@@ -401,11 +636,37 @@ class AudioProcessor:
         except Exception as e:
             self.logger.error(f"Could not move failed file: {e}")
             
+    def _thread_stats(self) -> Dict:
+        """Get the calling thread's statistics shard, creating it on first use."""
+        stats = getattr(self._local, 'stats', None)
+        if stats is None:
+            stats = {
+                'processed': 0,
+                'failed': 0,
+                'retried': 0,
+                'total_time': 0.0
+            }
+            self._local.stats = stats
+            with self._processing_lock:
+                self._stats_shards.append(stats)
+        return stats
+        
     def get_stats(self) -> Dict:
         """Get processing statistics."""
-        with self._processing_lock:
-            return self.stats.copy()
+        totals = {
+            'processed': 0,
+            'failed': 0,
+            'retried': 0,
+            'total_time': 0.0
+        }
+        # Copying the shard list is atomic, so reading never waits on a
+        # worker registering its shard
+        shards = tuple(self._stats_shards)
+        for shard in shards:
+            for key in totals:
+                totals[key] += shard[key]
+        return totals
             
     def get_queue_size(self) -> int:
         """Get the current size of the processing queue."""
-        return self.process_queue.qsize()
\ No newline at end of file
+        return len(self.process_queue)
\ No newline at end of file
@@ -2,6 +2,6 @@
 
 from .manager import ConfigManager
 from .schema import ConfigSchema
-from .defaults import DEFAULT_CONFIG
+from .defaults import DEFAULT_CONFIG, get_default_config
 
-__all__ = ['ConfigManager', 'ConfigSchema', 'DEFAULT_CONFIG']
\ No newline at end of file
+__all__ = ['ConfigManager', 'ConfigSchema', 'DEFAULT_CONFIG', 'get_default_config']
\ No newline at end of file
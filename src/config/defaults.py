@@ -5,6 +5,10 @@ This module defines the default configuration structure and values
 that are used when no configuration file is provided.
 """
 
+import os
+from types import MappingProxyType
+from typing import Any, Dict
+
 DEFAULT_CONFIG = {
     'obsidian_scribe': {
         # Paths configuration
@@ -18,7 +22,10 @@ DEFAULT_CONFIG = {
         # File watching configuration
         'watcher': {
             'file_extensions': ['.wav', '.mp3'],    # Supported audio formats
-            'poll_interval': 1.0,                   # Seconds between folder checks
+            'poll_interval': 30.0,                  # Seconds between folder scans when polling
+            'use_polling': None,                    # Force polling (None = auto-detect network mounts)
+            'debounce_seconds': 0.5,                # Drop repeat events for a file within this window
+            'created_settle_seconds': 10.0,         # Unchanged time before queuing a file with no close event
             'ignore_patterns': ['.*', '~*']         # Patterns to ignore
         },
         
@@ -70,7 +77,9 @@ DEFAULT_CONFIG = {
         
         # Processing configuration
         'processing': {
-            'concurrent_files': 1,                  # Number of files to process simultaneously
+            'concurrent_files': max(1, min(os.cpu_count() or 1, 4)),  # Files processed simultaneously
+            'transcribe_workers': 4,                # Chunks of one file transcribed simultaneously
+            'diarize_workers': 1,                   # Files diarized simultaneously
             'retry_failed': True,                   # Retry failed files
             'retry_delay': 60,                      # Seconds to wait before retry
             'max_retries': 3,                       # Maximum retry attempts
@@ -87,5 +96,36 @@ DEFAULT_CONFIG = {
     }
 }
 
-# Flatten the configuration for easier access
-DEFAULT_CONFIG = DEFAULT_CONFIG['obsidian_scribe']
\ No newline at end of file
+
+
+def _freeze(value: Any) -> Any:
+    """Recursively convert dicts to read-only mappings and lists to tuples."""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+def _thaw(value: Any) -> Any:
+    """Recursively convert read-only mappings and tuples back to dicts and lists."""
+    if isinstance(value, MappingProxyType):
+        return {key: _thaw(item) for key, item in value.items()}
+    if isinstance(value, tuple):
+        return [_thaw(item) for item in value]
+    return value
+
+
+# Flatten the configuration for easier access. The defaults are built once
+# at import and frozen so no caller can mutate them by accident
+DEFAULT_CONFIG = _freeze(DEFAULT_CONFIG['obsidian_scribe'])
+
+
+def get_default_config() -> Dict[str, Any]:
+    """
+    Get a mutable copy of the default configuration.
+    
+    Returns:
+        Deep copy of DEFAULT_CONFIG using plain dicts and lists
+    """
+    return _thaw(DEFAULT_CONFIG)
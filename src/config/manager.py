@@ -8,10 +8,18 @@ with validation and override support.
 import os
 import logging
 from pathlib import Path
-from typing import Dict, Any, Optional, Union
+from types import MappingProxyType
+from typing import Dict, Any, Mapping, Optional, Tuple, Union
 import yaml
 
-from .defaults import DEFAULT_CONFIG
+# libyaml's C loader and dumper are much faster; fall back to the pure
+# Python ones when PyYAML was built without it
+try:
+    from yaml import CSafeLoader as SafeLoader, CSafeDumper as SafeDumper
+except ImportError:
+    from yaml import SafeLoader, SafeDumper
+
+from .defaults import get_default_config
 from .schema import ConfigSchema
 
 
@@ -40,6 +48,9 @@ class ConfigManager:
         self.logger = logging.getLogger(__name__)
         self.config_path = config_path or self._find_config_file()
         self.config: Dict[str, Any] = {}
+        # Every dot-separated path in self.config mapped to its value, so get()
+        # is a single lookup; rebuilt whenever the configuration changes
+        self._flat: Dict[str, Any] = {}
         self.schema = ConfigSchema()
         self._load_config()
         self._initialized = True
@@ -69,13 +80,13 @@ class ConfigManager:
     def _load_config(self):
         """Load configuration from file and environment variables."""
         # Start with default configuration
-        self.config = DEFAULT_CONFIG.copy()
+        self.config = get_default_config()
         
         # Load from file if available
         if self.config_path and self.config_path.exists():
             try:
                 with open(self.config_path, 'r', encoding='utf-8') as f:
-                    file_config = yaml.safe_load(f) or {}
+                    file_config = yaml.load(f, Loader=SafeLoader) or {}
                     self._merge_config(self.config, file_config)
                     self.logger.info(f"Loaded configuration from: {self.config_path}")
             except Exception as e:
@@ -86,6 +97,20 @@ class ConfigManager:
         
         # Validate configuration
         self.schema.validate(self.config)
+        self._rebuild_flat()
+        
+    def _rebuild_flat(self):
+        """Rebuild the dot-separated path index used by get()."""
+        flat = {}
+        stack = [('', self.config)]
+        while stack:
+            prefix, node = stack.pop()
+            for key, value in node.items():
+                path = f"{prefix}{key}"
+                flat[path] = value
+                if isinstance(value, dict):
+                    stack.append((f"{path}.", value))
+        self._flat = flat
         
     def _merge_config(self, base: Dict, override: Dict):
         """
@@ -120,16 +145,16 @@ class ConfigManager:
                 self._set_nested_value(self.config, config_path, value)
                 self.logger.debug(f"Applied environment override: {env_var} -> {config_path}")
                 
-    def _set_nested_value(self, config: Dict, path: str, value: Any):
+    def _set_nested_value(self, config: Dict, path: Union[str, Tuple[str, ...]], value: Any):
         """
         Set a nested configuration value using dot notation.
         
         Args:
             config: Configuration dictionary
-            path: Dot-separated path to the value
+            path: Dot-separated path to the value, or its keys already split
             value: Value to set
         """
-        keys = path.split('.')
+        keys = path.split('.') if isinstance(path, str) else path
         current = config
         
         for key in keys[:-1]:
@@ -139,14 +164,14 @@ class ConfigManager:
             
         current[keys[-1]] = value
         
-    def get_config(self) -> Dict[str, Any]:
+    def get_config(self) -> Mapping[str, Any]:
         """
         Get the current configuration.
         
         Returns:
-            Configuration dictionary
+            Read-only view of the configuration; use set() to change it
         """
-        return self.config.copy()
+        return MappingProxyType(self.config)
         
     def get(self, path: str, default: Any = None) -> Any:
         """
@@ -159,16 +184,7 @@ class ConfigManager:
         Returns:
             Configuration value or default
         """
-        keys = path.split('.')
-        current = self.config
-        
-        for key in keys:
-            if isinstance(current, dict) and key in current:
-                current = current[key]
-            else:
-                return default
-                
-        return current
+        return self._flat.get(path, default)
         
     def set(self, path: str, value: Any):
         """
@@ -179,16 +195,19 @@ class ConfigManager:
             value: Value to set
         """
         self._set_nested_value(self.config, path, value)
+        self._rebuild_flat()
         
-    def apply_overrides(self, overrides: Dict[str, Any]):
+    def apply_overrides(self, overrides: Dict[Union[str, Tuple[str, ...]], Any]):
         """
         Apply configuration overrides.
         
         Args:
-            overrides: Dictionary of overrides with dot-separated paths as keys
+            overrides: Dictionary of overrides keyed by dot-separated path, or
+                by the path's keys as a tuple (e.g. ('paths', 'audio_folder'))
         """
         for path, value in overrides.items():
-            self.set(path, value)
+            self._set_nested_value(self.config, path, value)
+        self._rebuild_flat()
             
         # Re-validate configuration
         self.schema.validate(self.config)
@@ -209,7 +228,7 @@ class ConfigManager:
         
         # Save configuration
         with open(save_path, 'w', encoding='utf-8') as f:
-            yaml.dump(self.config, f, default_flow_style=False, sort_keys=False)
+            yaml.dump(self.config, f, Dumper=SafeDumper, default_flow_style=False, sort_keys=False)
             
         self.logger.info(f"Saved configuration to: {save_path}")
         
@@ -5,31 +5,35 @@ Main entry point for the application.
 """
 
 import argparse
+import functools
 import logging
 import os
 import signal
 import sys
-import time
+import threading
 from pathlib import Path
-from typing import Optional
-
-# Load environment variables from .env file
-from dotenv import load_dotenv
-load_dotenv()
+from typing import TYPE_CHECKING, Optional
 
 # Add parent directory to path for imports during development
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from src.watcher.file_watcher import FileWatcher
-from src.audio.processor import AudioProcessor
-from src.utils.logger import setup_logging
-from src.config.manager import ConfigManager
-from src.storage.file_manager import FileManager
+# Project modules are imported where they are first needed, so --help,
+# --version and argument errors return without loading any of them
+if TYPE_CHECKING:
+    from src.config.manager import ConfigManager
+    from src.watcher.file_watcher import FileWatcher
+    from src.audio.processor import AudioProcessor
+    from src.storage.file_manager import FileManager
 
 
 class ObsidianScribe:
     """Main application class for Obsidian Scribe."""
     
+    __slots__ = (
+        'config_manager', 'config', 'logger', 'file_watcher',
+        'processor', 'file_manager', '_running', '_stop_event'
+    )
+    
     def __init__(self, config_path: Optional[Path] = None):
         """
         Initialize Obsidian Scribe application.
@@ -37,18 +41,28 @@ class ObsidianScribe:
         Args:
             config_path: Path to configuration file (optional)
         """
-        self.config_manager = ConfigManager(config_path)
+        from src.config.manager import ConfigManager
+        
+        self.config_manager: 'ConfigManager' = ConfigManager(config_path)
         self.config = self.config_manager.get_config()
         self.logger = logging.getLogger(__name__)
-        self.file_watcher: Optional[FileWatcher] = None
-        self.processor: Optional[AudioProcessor] = None
-        self.file_manager: Optional[FileManager] = None
+        self.file_watcher: Optional['FileWatcher'] = None
+        self.processor: Optional['AudioProcessor'] = None
+        self.file_manager: Optional['FileManager'] = None
         self._running = False
+        self._stop_event = threading.Event()
         
     def setup(self):
         """Set up the application components."""
         self.logger.info("Setting up Obsidian Scribe...")
         
+        # Import pipeline components here so --help/--version and argument
+        # errors don't pay for watchdog, torch and pyannote at startup
+        from src.watcher.file_watcher import FileWatcher
+        from src.audio.processor import AudioProcessor
+        from src.storage.file_manager import FileManager
+        from src.utils.helpers import is_network_path
+        
         # Initialize file manager
         self.file_manager = FileManager(self.config)
         
@@ -64,6 +78,10 @@ class ObsidianScribe:
         watcher_config = self.config['watcher'].copy()
         watcher_config['file_extensions'] = self.config['audio']['formats']
         
+        # Fall back to polling only when the watch folder is on a network mount
+        if watcher_config.get('use_polling') is None:
+            watcher_config['use_polling'] = is_network_path(self.config['paths']['audio_folder'])
+            
         self.file_watcher = FileWatcher(
             watch_folder=self.config['paths']['audio_folder'],
             processor=self.processor,
@@ -74,6 +92,11 @@ class ObsidianScribe:
         
     def start(self):
         """Start the application."""
+        # A signal received during setup() already asked us to stop
+        if self._stop_event.is_set():
+            self.logger.info("Stop requested during setup, not starting")
+            return
+            
         self.logger.info("Starting Obsidian Scribe...")
         self._running = True
         
@@ -86,27 +109,38 @@ class ObsidianScribe:
         self.logger.info("Obsidian Scribe is running. Press Ctrl+C to stop.")
         
         # Main event loop with status monitoring
-        last_status_time = time.time()
         status_interval = 30  # Show status every 30 seconds
         
         try:
-            while self._running:
-                time.sleep(1)
-                
-                # Show periodic status updates
-                current_time = time.time()
-                if current_time - last_status_time >= status_interval:
-                    self._show_status()
-                    last_status_time = current_time
+            # Park until stop() sets the event, waking only for status updates
+            while not self._stop_event.wait(timeout=status_interval):
+                self._show_status()
                     
         except KeyboardInterrupt:
             self.logger.info("Received interrupt signal")
+            
+        # Shut down on the main thread once a stop has been requested
+        if self._running:
             self.stop()
             
+    def request_stop(self):
+        """
+        Ask the main loop to shut down.
+        
+        Only sets an event, so it is safe to call from a signal handler.
+        """
+        self._stop_event.set()
+        
+    @property
+    def stop_requested(self) -> bool:
+        """Whether a stop has been requested."""
+        return self._stop_event.is_set()
+        
     def stop(self):
         """Stop the application gracefully."""
         self.logger.info("Stopping Obsidian Scribe...")
         self._running = False
+        self._stop_event.set()
         
         # Stop components
         if self.file_watcher:
@@ -147,8 +181,9 @@ class ObsidianScribe:
             sys.exit(1)
 
 
-def parse_arguments():
-    """Parse command-line arguments."""
+@functools.lru_cache(maxsize=None)
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the command-line argument parser (once per process)."""
     parser = argparse.ArgumentParser(
         description="Obsidian Scribe - Advanced audio processing for Obsidian",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -222,13 +257,24 @@ Examples:
         help='Custom naming template (e.g., "{date}_{source_name}")'
     )
     
-    return parser.parse_args()
+    return parser
+
+
+def parse_arguments():
+    """Parse command-line arguments."""
+    return _build_parser().parse_args()
 
 
 def main():
     """Main entry point."""
     args = parse_arguments()
     
+    from dotenv import load_dotenv
+    from src.utils.logger import setup_logging
+    
+    # Load environment variables from .env file
+    load_dotenv()
+    
     # Set up logging
     log_config = {
         'logging': {
@@ -247,27 +293,28 @@ def main():
     logger.info(f"Working directory: {os.getcwd()}")
     logger.info("=" * 60)
     
-    # Handle command-line overrides
+    # Handle command-line overrides, keyed by config path already split
+    # into its keys
     config_overrides = {}
     if args.watch:
-        config_overrides['paths.audio_folder'] = str(args.watch)
+        config_overrides[('paths', 'audio_folder')] = str(args.watch)
     if args.output:
-        config_overrides['paths.transcript_folder'] = str(args.output)
+        config_overrides[('paths', 'transcript_folder')] = str(args.output)
     
     # Handle diarization overrides
     if args.no_diarization:
-        config_overrides['diarization.enabled'] = False
+        config_overrides[('diarization', 'enabled')] = False
         logger.info("Diarization disabled via command line")
     elif args.enable_diarization:
-        config_overrides['diarization.enabled'] = True
+        config_overrides[('diarization', 'enabled')] = True
         logger.info("Diarization enabled via command line")
     
     # Handle naming overrides
     if args.output_name:
-        config_overrides['transcript.naming.template'] = args.output_name
+        config_overrides[('transcript', 'naming', 'template')] = args.output_name
         logger.info(f"Custom output name: {args.output_name}")
     if args.naming_template:
-        config_overrides['transcript.naming.template'] = args.naming_template
+        config_overrides[('transcript', 'naming', 'template')] = args.naming_template
         logger.info(f"Custom naming template: {args.naming_template}")
     
     # Create and run the application
@@ -278,11 +325,15 @@ def main():
         logger.info(f"Applying command-line overrides: {config_overrides}")
         app.config_manager.apply_overrides(config_overrides)
     
-    # Set up signal handlers for graceful shutdown
+    # Set up signal handlers for graceful shutdown. The handler only wakes
+    # the main loop; the blocking shutdown work runs after start() returns.
+    # A second signal exits at once without waiting for in-flight files
     def signal_handler(signum, frame):
+        if app.stop_requested:
+            logger.warning(f"Received signal {signum} again, exiting immediately")
+            os._exit(128 + signum)
         logger.info(f"Received signal {signum}")
-        app.stop()
-        sys.exit(0)
+        app.request_stop()
     
     signal.signal(signal.SIGINT, signal_handler)
     signal.signal(signal.SIGTERM, signal_handler)
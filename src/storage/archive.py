@@ -41,29 +41,38 @@ class ArchiveManager:
         # Ensure archive directory exists
         self.file_manager.ensure_directory(self.archive_dir)
         
+        # Last archive subdirectory created; consecutive files usually share it
+        self._last_subdir: Optional[Path] = None
+        
     def archive_file(self, file_path: Union[str, Path], 
-                    metadata: Optional[Dict] = None) -> Path:
+                    metadata: Optional[Dict] = None, move: bool = False) -> Path:
         """
         Archive a single file.
         
         Args:
             file_path: Path to file to archive
             metadata: Optional metadata to store with the file
+            move: Move the file into the archive instead of copying it. On the
+                same filesystem this is a rename rather than a full copy
             
         Returns:
             Path to archived file
         """
         file_path = Path(file_path)
         
-        if not file_path.exists():
-            raise FileNotFoundError(f"File not found: {file_path}")
-            
         # Determine archive location
         archive_subdir = self._get_archive_subdir(file_path, metadata)
         archive_dest = archive_subdir / file_path.name
         
-        # Copy file to archive
-        archived_path = self.file_manager.copy_file(file_path, archive_dest)
+        # Move or copy file to archive. A missing source surfaces from the
+        # rename/copy itself rather than from a separate exists() stat
+        try:
+            if move:
+                archived_path = self.file_manager.move_file(file_path, archive_dest)
+            else:
+                archived_path = self.file_manager.copy_file(file_path, archive_dest)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"File not found: {file_path}") from None
         
         # Save metadata if provided
         if metadata:
@@ -164,7 +173,9 @@ class ArchiveManager:
             subdir = datetime.now().strftime('%Y/%m')
             
         full_path = self.archive_dir / subdir
-        self.file_manager.ensure_directory(full_path)
+        if full_path != self._last_subdir:
+            self.file_manager.ensure_directory(full_path)
+            self._last_subdir = full_path
         return full_path
         
     def _compress_directory(self, directory: Path) -> Path:
@@ -4,15 +4,40 @@ File management utilities for Obsidian Scribe.
 Provides safe file operations with atomic writes, validation, and error handling.
 """
 
+import errno
 import os
 import shutil
+import sys
+from stat import S_ISREG
 import tempfile
 import logging
 from pathlib import Path
-from typing import Dict, Optional, Union, List
+from typing import Dict, Optional, Tuple, Union, List
 from contextlib import contextmanager
 import hashlib
+import itertools
 import json
+import time
+
+# Seconds a directory is trusted to still exist after it was last checked
+DIRECTORY_CACHE_TTL = 60.0
+
+# Per-process sequence that keeps renamed conflict copies unique even when
+# several land within the clock's resolution
+_UNIQUE_SEQUENCE = itertools.count()
+
+# Buffer size for user-space file copies
+COPY_BUFFER_SIZE = 1024 * 1024
+
+# errno values meaning an in-kernel copy isn't available for these files
+_KERNEL_COPY_UNSUPPORTED = frozenset({
+    errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP, errno.EBADF, errno.ENOTSUP
+})
+
+# File extensions accepted as audio input
+AUDIO_EXTENSIONS = frozenset({
+    '.wav', '.mp3', '.m4a', '.flac', '.ogg', '.wma', '.aac', '.opus', '.webm'
+})
 
 
 class FileManager:
@@ -27,6 +52,10 @@ class FileManager:
         """
         self.config = config
         self.logger = logging.getLogger(__name__)
+        # Directories known to exist, mapped to when that was last confirmed
+        self._known_dirs: Dict[str, float] = {}
+        # Filesystem device of each directory files are moved between
+        self._dir_devices: Dict[str, int] = {}
         self.temp_dir = Path(config.get('paths', {}).get('temp_folder', './temp'))
         self.ensure_directory(self.temp_dir)
         
@@ -41,32 +70,136 @@ class FileManager:
             Path object for the directory
         """
         path = Path(directory)
-        path.mkdir(parents=True, exist_ok=True)
+        key = os.fspath(path)
+        
+        # Skip the filesystem entirely for recently confirmed directories;
+        # entries expire so an externally deleted directory is recreated
+        now = time.monotonic()
+        if now - self._known_dirs.get(key, float('-inf')) < DIRECTORY_CACHE_TTL:
+            return path
+            
+        # A single stat is cheaper than a failing mkdir, especially on network mounts
+        if not os.path.isdir(path):
+            path.mkdir(parents=True, exist_ok=True)
+            
+        if len(self._known_dirs) >= 256:
+            self._known_dirs.clear()
+        self._known_dirs[key] = now
         return path
         
-    def validate_audio_file(self, file_path: Union[str, Path]) -> bool:
+    def _recreate_directory(self, directory: Path) -> bool:
+        """
+        Recreate a directory that was cached as existing but has been removed.
+        
+        Args:
+            directory: Path to directory
+            
+        Returns:
+            True if the directory was missing and has been recreated
+        """
+        if directory.is_dir():
+            return False
+        self._known_dirs.pop(os.fspath(directory), None)
+        self._dir_devices.pop(os.fspath(directory), None)
+        self.ensure_directory(directory)
+        return True
+        
+    def _same_device(self, source: Path, destination: Path) -> bool:
+        """
+        Check whether two paths' directories are on the same filesystem.
+        
+        Device numbers are cached per directory, so moves into the fixed
+        archive and transcript folders stat each directory only once.
+        
+        Args:
+            source: Source file path
+            destination: Destination file path
+            
+        Returns:
+            False only if the directories are known to be on different devices
+        """
+        devices = []
+        for directory in (source.parent, destination.parent):
+            key = os.fspath(directory)
+            device = self._dir_devices.get(key)
+            if device is None:
+                try:
+                    device = os.stat(key).st_dev
+                except OSError:
+                    # Let the move itself report the real error
+                    return True
+                if len(self._dir_devices) >= 256:
+                    self._dir_devices.clear()
+                self._dir_devices[key] = device
+            devices.append(device)
+        return devices[0] == devices[1]
+        
+    def validate_audio_file(self, file_path: Union[str, Path],
+                            file_info: Optional[Dict] = None) -> bool:
         """
         Validate that a file is a valid audio file.
         
         Args:
             file_path: Path to the audio file
+            file_info: Result of get_file_info() for this file, if the
+                caller already has it (avoids another stat)
             
         Returns:
             True if file is valid audio file
         """
-        file_path = Path(file_path)
-        
+        if file_info is None:
+            file_info = self.get_file_info(file_path)
+            
         # Check if file exists
-        if not file_path.exists() or not file_path.is_file():
+        if not file_info or not file_info['is_file']:
             return False
             
         # Check file extension
-        valid_extensions = {'.wav', '.mp3', '.m4a', '.flac', '.ogg', '.wma', '.aac', '.opus', '.webm'}
-        if file_path.suffix.lower() not in valid_extensions:
+        if file_info['extension'] not in AUDIO_EXTENSIONS:
             return False
             
-        # Check file size (minimum 1KB, maximum from config)
-        file_size = file_path.stat().st_size
+        return self._is_valid_audio_size(file_info['size'])
+        
+    def batch_validate(self, directory: Union[str, Path]) -> List[Path]:
+        """
+        Validate every audio file in a directory from a single listing.
+        
+        Uses the file type from the directory entries and only stats files
+        with an audio extension, instead of a full validate_audio_file()
+        per path.
+        
+        Args:
+            directory: Directory to scan
+            
+        Returns:
+            Paths of the valid audio files
+        """
+        valid_files = []
+        
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if not entry.is_file():
+                        continue
+                    if os.path.splitext(entry.name)[1].lower() not in AUDIO_EXTENSIONS:
+                        continue
+                    if self._is_valid_audio_size(entry.stat().st_size):
+                        valid_files.append(Path(entry.path))
+        except FileNotFoundError:
+            return []
+            
+        return valid_files
+        
+    def _is_valid_audio_size(self, file_size: int) -> bool:
+        """
+        Check an audio file's size (minimum 1KB, maximum from config).
+        
+        Args:
+            file_size: File size in bytes
+            
+        Returns:
+            True if the size is acceptable
+        """
         if file_size < 1024:  # Less than 1KB
             return False
             
@@ -87,24 +220,29 @@ class FileManager:
         Returns:
             Dictionary with file information
         """
-        file_path = Path(file_path)
+        # Plain string paths; building a Path costs more than the stat itself
+        path = os.fspath(file_path)
         
-        if not file_path.exists():
+        # One stat covers existence, type and size
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
             return {}
             
-        stat = file_path.stat()
-        
+        name = os.path.basename(path)
+        stem, extension = os.path.splitext(name)
         return {
-            'name': file_path.name,
-            'path': str(file_path),
-            'absolute_path': str(file_path.absolute()),
+            'name': name,
+            'path': path,
+            'absolute_path': os.path.abspath(path),
+            'is_file': S_ISREG(stat.st_mode),
             'size': stat.st_size,
             'size_mb': stat.st_size / (1024 * 1024),
-            'extension': file_path.suffix.lower(),
+            'extension': extension.lower(),
             'created': stat.st_ctime,
             'modified': stat.st_mtime,
-            'parent': str(file_path.parent),
-            'stem': file_path.stem
+            'parent': os.path.dirname(path) or '.',
+            'stem': stem
         }
         
     @contextmanager
@@ -126,11 +264,13 @@ class FileManager:
         self.ensure_directory(file_path.parent)
         
         # Create temporary file in the same directory for atomic rename
-        temp_fd, temp_path = tempfile.mkstemp(
-            dir=file_path.parent,
-            prefix=f'.{file_path.name}.',
-            suffix='.tmp'
-        )
+        temp_options = {'dir': file_path.parent, 'prefix': f'.{file_path.name}.', 'suffix': '.tmp'}
+        try:
+            temp_fd, temp_path = tempfile.mkstemp(**temp_options)
+        except FileNotFoundError:
+            if not self._recreate_directory(file_path.parent):
+                raise
+            temp_fd, temp_path = tempfile.mkstemp(**temp_options)
         
         try:
             with os.fdopen(temp_fd, mode) as f:
@@ -198,7 +338,12 @@ class FileManager:
         self.ensure_directory(destination.parent)
         
         # Copy with metadata preservation
-        shutil.copy2(str(source), str(destination))
+        try:
+            shutil.copy2(str(source), str(destination))
+        except FileNotFoundError:
+            if not self._recreate_directory(destination.parent):
+                raise
+            shutil.copy2(str(source), str(destination))
         
         self.logger.debug(f"Copied {source} to {destination}")
         return destination
@@ -214,29 +359,102 @@ class FileManager:
         Returns:
             Path to the copied file
         """
-        from datetime import datetime
-        
         source = Path(source)
         destination = Path(destination)
         
         # Ensure destination directory exists
         self.ensure_directory(destination.parent)
         
-        # Handle case where destination already exists
-        if destination.exists():
-            # Add timestamp to make unique
-            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-            stem = destination.stem
-            suffix = destination.suffix
-            destination = destination.parent / f"{stem}_{timestamp}{suffix}"
-        
         # Copy the file
         try:
-            shutil.copy2(str(source), str(destination))
+            with open(source, 'rb') as src:
+                # Creating the destination with O_EXCL both checks for and
+                # claims the name in one step
+                try:
+                    fd, destination = self._open_unique(destination)
+                except FileNotFoundError:
+                    if not self._recreate_directory(destination.parent):
+                        raise
+                    fd, destination = self._open_unique(destination)
+                try:
+                    with os.fdopen(fd, 'wb') as dst:
+                        self._copy_file_data(src, dst)
+                    shutil.copystat(source, destination)
+                except BaseException:
+                    # Don't leave a partial copy behind
+                    destination.unlink(missing_ok=True)
+                    raise
+                    
             self.logger.debug(f"Safely copied {source} to {destination}")
             return destination
         except Exception as e:
             raise OSError(f"Failed to copy file from {source} to {destination}: {e}")
+            
+    def _copy_file_data(self, src, dst):
+        """
+        Copy the contents of one open file to another, in-kernel if possible.
+        
+        Tries copy_file_range (which can share extents on reflink
+        filesystems), then sendfile on Linux, then a buffered user-space
+        copy. Each method picks up where the previous one stopped, so a
+        short or unsupported kernel copy is finished by the next method.
+        
+        Args:
+            src: Source file opened for binary reading
+            dst: Destination file opened for binary writing
+        """
+        src_fd, dst_fd = src.fileno(), dst.fileno()
+        size = os.fstat(src_fd).st_size
+        copied = 0
+        
+        if hasattr(os, 'copy_file_range'):
+            try:
+                while copied < size:
+                    sent = os.copy_file_range(src_fd, dst_fd, size - copied)
+                    if sent == 0:
+                        break
+                    copied += sent
+            except OSError as e:
+                if e.errno not in _KERNEL_COPY_UNSUPPORTED:
+                    raise
+            if copied >= size:
+                return
+                
+        if sys.platform.startswith('linux'):
+            try:
+                while copied < size:
+                    sent = os.sendfile(dst_fd, src_fd, copied, size - copied)
+                    if sent == 0:
+                        break
+                    copied += sent
+            except OSError as e:
+                if e.errno not in _KERNEL_COPY_UNSUPPORTED:
+                    raise
+            if copied >= size:
+                return
+                
+        # sendfile() doesn't move the source offset, so line both files up
+        # with what has been copied so far
+        src.seek(copied)
+        dst.seek(copied)
+        shutil.copyfileobj(src, dst, COPY_BUFFER_SIZE)
+        
+    def _open_unique(self, destination: Path) -> Tuple[int, Path]:
+        """
+        Create and open a destination file that did not exist before.
+        
+        Args:
+            destination: Preferred destination file path
+            
+        Returns:
+            Tuple of (writable file descriptor, path actually created)
+        """
+        flags = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, 'O_BINARY', 0)
+        try:
+            return os.open(destination, flags, 0o644), destination
+        except FileExistsError:
+            destination = self._timestamped_path(destination)
+            return os.open(destination, flags, 0o644), destination
         
     def move_file(self, source: Union[str, Path], destination: Union[str, Path]) -> Path:
         """
@@ -255,12 +473,43 @@ class FileManager:
         # Ensure destination directory exists
         self.ensure_directory(destination.parent)
         
-        # Use shutil.move for cross-filesystem support
-        shutil.move(str(source), str(destination))
+        try:
+            self._rename_or_copy(source, destination)
+        except FileNotFoundError:
+            if not self._recreate_directory(destination.parent):
+                raise
+            self._rename_or_copy(source, destination)
         
         self.logger.debug(f"Moved {source} to {destination}")
         return destination
         
+    def _rename_or_copy(self, source: Path, destination: Path):
+        """
+        Move a file by renaming it, copying in-kernel across filesystems.
+        
+        Args:
+            source: Source file path
+            destination: Destination file path
+        """
+        if self._same_device(source, destination):
+            try:
+                os.replace(source, destination)
+                return
+            except OSError as e:
+                if e.errno != errno.EXDEV:
+                    raise
+                
+        # Different filesystem (e.g. archive on a network share). copyfile
+        # uses sendfile() on Linux, so the data never passes through Python
+        try:
+            shutil.copyfile(source, destination)
+            shutil.copystat(source, destination)
+        except BaseException:
+            # Don't leave a partial copy behind
+            destination.unlink(missing_ok=True)
+            raise
+        source.unlink()
+        
     def move_file_safely(self, source: Union[str, Path], destination: Union[str, Path]) -> Path:
         """
         Safely move a file from source to destination with automatic renaming if exists.
@@ -272,36 +521,73 @@ class FileManager:
         Returns:
             Path to the moved file
         """
-        from datetime import datetime
-        
         source = Path(source)
         destination = Path(destination)
         
         # Ensure destination directory exists
         self.ensure_directory(destination.parent)
         
-        # Handle case where destination already exists
-        if destination.exists():
-            # Add timestamp to make unique
-            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-            stem = destination.stem
-            suffix = destination.suffix
-            destination = destination.parent / f"{stem}_{timestamp}{suffix}"
-        
         # Try to move the file
         try:
-            shutil.move(str(source), str(destination))
+            try:
+                destination = self._link_or_move(source, destination)
+            except FileNotFoundError:
+                if not self._recreate_directory(destination.parent):
+                    raise
+                destination = self._link_or_move(source, destination)
+                
             self.logger.debug(f"Safely moved {source} to {destination}")
             return destination
         except Exception as e:
-            # If move fails, try copy and delete
+            raise OSError(f"Failed to move file from {source} to {destination}: {e}")
+            
+    def _link_or_move(self, source: Path, destination: Path) -> Path:
+        """
+        Move a file to a destination that doesn't exist yet.
+        
+        Args:
+            source: Source file path
+            destination: Preferred destination file path
+            
+        Returns:
+            Path the file was moved to
+        """
+        # A hard link fails atomically if the destination exists, so the
+        # usual no-conflict case needs no separate exists() check. Across
+        # filesystems the link can never succeed, so it is not attempted.
+        linked = False
+        if self._same_device(source, destination):
             try:
-                shutil.copy2(str(source), str(destination))
-                source.unlink()
-                self.logger.debug(f"Safely moved {source} to {destination} (via copy+delete)")
-                return destination
-            except Exception:
-                raise OSError(f"Failed to move file from {source} to {destination}: {e}")
+                os.link(source, destination)
+                linked = True
+            except FileExistsError:
+                destination = self._timestamped_path(destination)
+            except OSError:
+                # No hard link support (e.g. FAT, SMB)
+                if destination.exists():
+                    destination = self._timestamped_path(destination)
+        elif destination.exists():
+            destination = self._timestamped_path(destination)
+            
+        if linked:
+            source.unlink()
+        else:
+            self._rename_or_copy(source, destination)
+        return destination
+        
+    def _timestamped_path(self, destination: Path) -> Path:
+        """
+        Make a conflicting destination unique by adding a timestamp tag.
+        
+        Args:
+            destination: Destination file path that already exists
+            
+        Returns:
+            Destination path with a nanosecond timestamp and sequence number
+            added to the name
+        """
+        tag = f"{time.time_ns():x}_{next(_UNIQUE_SEQUENCE)}"
+        return destination.parent / f"{destination.stem}_{tag}{destination.suffix}"
         
     def delete_file(self, file_path: Union[str, Path]):
         """
@@ -313,9 +599,10 @@ class FileManager:
         file_path = Path(file_path)
         
         try:
-            if file_path.exists():
-                file_path.unlink()
-                self.logger.debug(f"Deleted {file_path}")
+            file_path.unlink()
+            self.logger.debug(f"Deleted {file_path}")
+        except FileNotFoundError:
+            pass
         except Exception as e:
             self.logger.error(f"Error deleting file {file_path}: {e}")
             raise
@@ -346,21 +633,22 @@ class FileManager:
         Args:
             max_age_hours: Maximum age of temp files in hours
         """
-        import time
-        
         current_time = time.time()
         max_age_seconds = max_age_hours * 3600
         
         cleaned = 0
-        for temp_file in self.temp_dir.iterdir():
-            if temp_file.is_file():
-                file_age = current_time - temp_file.stat().st_mtime
-                if file_age > max_age_seconds:
-                    try:
-                        temp_file.unlink()
-                        cleaned += 1
-                    except Exception as e:
-                        self.logger.warning(f"Could not delete temp file {temp_file}: {e}")
+        with os.scandir(self.temp_dir) as entries:
+            for entry in entries:
+                # DirEntry.is_file() comes from the directory listing, so
+                # only the mtime needs a stat
+                if entry.is_file():
+                    file_age = current_time - entry.stat().st_mtime
+                    if file_age > max_age_seconds:
+                        try:
+                            os.unlink(entry.path)
+                            cleaned += 1
+                        except Exception as e:
+                            self.logger.warning(f"Could not delete temp file {entry.path}: {e}")
                         
         if cleaned > 0:
             self.logger.info(f"Cleaned {cleaned} old temporary files")
@@ -476,31 +764,24 @@ class FileManager:
         Returns:
             True if file is ready, False if timeout reached
         """
-        import time
-        
-        file_path = Path(file_path)
-        start_time = time.time()
+        file_path = os.fspath(file_path)
+        deadline = time.monotonic() + timeout
         last_size = -1
         
-        while time.time() - start_time < timeout:
-            if not file_path.exists():
-                time.sleep(check_interval)
-                continue
-                
+        while time.monotonic() < deadline:
             try:
-                current_size = file_path.stat().st_size
+                current_size = os.stat(file_path).st_size
                 
                 # Check if size is stable
                 if current_size == last_size and current_size > 0:
                     # Try to open the file to ensure it's not locked
-                    with open(file_path, 'rb') as f:
-                        # File is accessible
+                    with open(file_path, 'rb'):
                         return True
                         
                 last_size = current_size
                 
-            except (OSError, IOError):
-                # File might be locked or in use
+            except OSError:
+                # File might not exist yet, or be locked or in use
                 pass
                 
             time.sleep(check_interval)
@@ -7,7 +7,7 @@ and organizing speaker sections.
 
 import logging
 import re
-from datetime import timedelta
+from functools import lru_cache
 from typing import Dict, List, Optional, Tuple
 
 
@@ -28,6 +28,14 @@ class TranscriptFormatter:
         self.markdown_config = config.get('markdown', {})
         self.include_timestamps = self.markdown_config.get('include_timestamps', True)
         self.timestamp_format = self.markdown_config.get('timestamp_format', '[%H:%M:%S]')
+        # Compile the %H/%M/%S placeholders into a str.format template once
+        self._timestamp_template = (
+            self.timestamp_format.replace('{', '{{').replace('}', '}}')
+            .replace('%H', '{0:02d}').replace('%M', '{1:02d}').replace('%S', '{2:02d}')
+        )
+        # Segment boundaries repeat the same whole seconds, so memoize the
+        # formatted string per second (per instance, as the format is)
+        self._format_whole_seconds = lru_cache(maxsize=4096)(self._format_whole_seconds)
         self.speaker_emoji = self.markdown_config.get('speaker_emoji', '🗣')
         
         # Formatting options
@@ -264,21 +272,24 @@ class TranscriptFormatter:
         Returns:
             Formatted timestamp
         """
-        # Convert to timedelta for easy formatting
-        td = timedelta(seconds=int(seconds))
+        return self._format_whole_seconds(int(max(seconds, 0.0)))
         
+    def _format_whole_seconds(self, seconds: int) -> str:
+        """
+        Format a non-negative whole number of seconds (memoized in __init__).
+        
+        Args:
+            seconds: Time in whole seconds
+            
+        Returns:
+            Formatted timestamp
+        """
         # Extract components
-        hours = td.seconds // 3600
-        minutes = (td.seconds % 3600) // 60
-        secs = td.seconds % 60
+        minutes, secs = divmod(seconds, 60)
+        hours, minutes = divmod(minutes, 60)
         
         # Format according to configuration
-        timestamp = self.timestamp_format
-        timestamp = timestamp.replace('%H', f'{hours:02d}')
-        timestamp = timestamp.replace('%M', f'{minutes:02d}')
-        timestamp = timestamp.replace('%S', f'{secs:02d}')
-        
-        return timestamp
+        return self._timestamp_template.format(hours, minutes, secs)
         
     def _format_single_speaker(self, text: str) -> str:
         """
@@ -300,6 +311,7 @@ class TranscriptFormatter:
         sentences = re.split(r'([.!?]+\s+)', text)
         
         current_paragraph = []
+        paragraph_length = 0  # Length of ' '.join(current_paragraph), kept incrementally
         for i in range(0, len(sentences), 2):
             if i + 1 < len(sentences):
                 sentence = sentences[i] + sentences[i + 1]
@@ -310,12 +322,16 @@ class TranscriptFormatter:
             if not sentence:
                 continue
                 
+            if current_paragraph:
+                paragraph_length += 1
             current_paragraph.append(sentence)
+            paragraph_length += len(sentence)
             
             # Create paragraph breaks at natural points
-            if len(' '.join(current_paragraph)) > 300:  # Approximate paragraph length
+            if paragraph_length > 300:  # Approximate paragraph length
                 lines.append(' '.join(current_paragraph))
                 current_paragraph = []
+                paragraph_length = 0
                 
         # Add final paragraph
         if current_paragraph:
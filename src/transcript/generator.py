@@ -6,8 +6,8 @@ structured transcripts with speaker identification.
 """
 
 import logging
+import os
 from datetime import datetime
-from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 from .markdown_writer import MarkdownWriter
 from .formatter import TranscriptFormatter
@@ -51,6 +51,10 @@ class TranscriptGenerator:
         try:
             self.logger.info(f"Generating transcript for: {audio_path}")
             
+            # Single timestamp shared by the metadata, front matter, header
+            # and filename so they all agree
+            now = datetime.now()
+            
             # Extract data from results
             if diarization_result is not None:
                 speaker_segments = diarization_result.get('segments', [])
@@ -68,7 +72,7 @@ class TranscriptGenerator:
             full_text = transcription_result.get('text', '')
             
             # Generate metadata
-            metadata = self._generate_metadata(audio_path, diarization_result, transcription_result)
+            metadata = self._generate_metadata(audio_path, diarization_result, transcription_result, now)
             
             # Format transcript content
             content = self.formatter.format_transcript(
@@ -81,7 +85,8 @@ class TranscriptGenerator:
             transcript_path = self.markdown_writer.write_transcript(
                 content,
                 metadata,
-                audio_path
+                audio_path,
+                now
             )
             
             self.logger.info(f"Transcript generated: {transcript_path}")
@@ -228,7 +233,7 @@ class TranscriptGenerator:
         return {'Speaker 1': speaker_segments}
         
     def _generate_metadata(self, audio_path: str, diarization_result: Optional[Dict],
-                          transcription_result: Dict) -> Dict:
+                          transcription_result: Dict, now: Optional[datetime] = None) -> Dict:
         """
         Generate metadata for the transcript.
         
@@ -236,11 +241,13 @@ class TranscriptGenerator:
             audio_path: Path to the audio file
             diarization_result: Diarization results
             transcription_result: Transcription results
+            now: Generation time (defaults to the current time)
             
         Returns:
             Metadata dictionary
         """
-        audio_file = Path(audio_path)
+        audio_filename = os.path.basename(audio_path)
+        now = now or datetime.now()
         
         # Calculate statistics
         if diarization_result is not None:
@@ -265,9 +272,9 @@ class TranscriptGenerator:
             speaker_stats = {'Speaker 1': {'duration': 0, 'segment_count': len(segments)}}
                 
         metadata = {
-            'title': f"Transcript: {audio_file.stem}",
-            'audio_file': audio_file.name,
-            'date': datetime.now().isoformat(),
+            'title': f"Transcript: {os.path.splitext(audio_filename)[0]}",
+            'audio_file': audio_filename,
+            'date': now.isoformat(),
             'duration': transcription_result.get('duration', 0),
             'language': transcription_result.get('language', 'en'),
             'speakers': speakers,
@@ -6,6 +6,7 @@ formatted transcripts, and proper structure.
 """
 
 import logging
+import os
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional
@@ -40,7 +41,8 @@ class MarkdownWriter:
         self.transcript_folder = Path(self.paths.get('transcript_folder', './Transcripts'))
         self.transcript_folder.mkdir(parents=True, exist_ok=True)
         
-    def write_transcript(self, content: str, metadata: Dict, audio_path: str) -> str:
+    def write_transcript(self, content: str, metadata: Dict, audio_path: str,
+                         now: Optional[datetime] = None) -> str:
         """
         Write transcript content to a Markdown file.
         
@@ -48,18 +50,24 @@ class MarkdownWriter:
             content: Formatted transcript content
             metadata: Transcript metadata
             audio_path: Path to the original audio file
+            now: Transcription time (defaults to the current time)
             
         Returns:
             Path to the created transcript file
         """
         try:
+            now = now or datetime.now()
+            
+            # Split the audio path once; the name and stem are reused below
+            audio_filename = os.path.basename(audio_path)
+            source_name = os.path.splitext(audio_filename)[0]
+            
             # Generate filename using template
-            audio_file = Path(audio_path)
-            transcript_filename = self._generate_filename(audio_path, metadata)
+            transcript_filename = self._generate_filename(source_name, metadata, now)
             transcript_path = self.transcript_folder / transcript_filename
             
             # Create full document
-            document = self._create_document(content, metadata, audio_file.name)
+            document = self._create_document(content, metadata, audio_filename, now)
             
             # Write to file
             with open(transcript_path, 'w', encoding='utf-8') as f:
@@ -72,7 +80,8 @@ class MarkdownWriter:
             self.logger.error(f"Failed to write transcript: {e}")
             raise
             
-    def _create_document(self, content: str, metadata: Dict, audio_filename: str) -> str:
+    def _create_document(self, content: str, metadata: Dict, audio_filename: str,
+                         now: datetime) -> str:
         """
         Create the full Markdown document with front matter.
         
@@ -80,17 +89,18 @@ class MarkdownWriter:
             content: Transcript content
             metadata: Metadata dictionary
             audio_filename: Name of the audio file
+            now: Transcription time
             
         Returns:
             Complete Markdown document
         """
         # Create YAML front matter
-        front_matter = self._create_front_matter(metadata, audio_filename)
+        front_matter = self._create_front_matter(metadata, audio_filename, now)
         
         # Create document sections
         sections = [
             front_matter,
-            self._create_header(metadata),
+            self._create_header(metadata, now),
             self._create_summary_section(metadata),
             content,
             self._create_footer(audio_filename)
@@ -99,13 +109,14 @@ class MarkdownWriter:
         # Join sections with double newlines
         return '\n\n'.join(filter(None, sections))
         
-    def _create_front_matter(self, metadata: Dict, audio_filename: str) -> str:
+    def _create_front_matter(self, metadata: Dict, audio_filename: str, now: datetime) -> str:
         """
         Create YAML front matter for Obsidian.
         
         Args:
             metadata: Metadata dictionary
             audio_filename: Name of the audio file
+            now: Transcription time
             
         Returns:
             YAML front matter string
@@ -113,8 +124,8 @@ class MarkdownWriter:
         # Build front matter data
         front_matter_data = {
             'title': metadata.get('title', self.default_title),
-            'date': datetime.now().strftime('%Y-%m-%d'),
-            'time': datetime.now().strftime('%H:%M:%S'),
+            'date': now.strftime('%Y-%m-%d'),
+            'time': now.strftime('%H:%M:%S'),
             'tags': self.default_tags.copy(),
             'audio_file': audio_filename,
             'duration': self._format_duration(metadata.get('duration', 0)),
@@ -141,18 +152,19 @@ class MarkdownWriter:
         
         return f"---\n{yaml_content}---"
         
-    def _create_header(self, metadata: Dict) -> str:
+    def _create_header(self, metadata: Dict, now: datetime) -> str:
         """
         Create the document header.
         
         Args:
             metadata: Metadata dictionary
+            now: Transcription time
             
         Returns:
             Header string
         """
         title = metadata.get('title', self.default_title)
-        date = datetime.now().strftime('%B %d, %Y at %I:%M %p')
+        date = now.strftime('%B %d, %Y at %I:%M %p')
         
         header_lines = [
             f"# {title}",
@@ -279,29 +291,28 @@ class MarkdownWriter:
             self.logger.error(f"Failed to create index file: {e}")
             raise
             
-    def _generate_filename(self, audio_path: str, metadata: Dict) -> str:
+    def _generate_filename(self, source_name: str, metadata: Dict, now: datetime) -> str:
         """
         Generate filename based on template configuration.
         
         Args:
-            audio_path: Path to the original audio file
+            source_name: Audio filename without its extension
             metadata: Transcript metadata
+            now: Transcription time
             
         Returns:
             Generated filename with .md extension
         """
-        audio_file = Path(audio_path)
         naming_config = self.config.get('transcript', {}).get('naming', {})
         
         # Get template
         template = naming_config.get('template', '{source_name}_transcript')
         
         # Build template variables
-        now = datetime.now()
         variables = {
             'date': now.strftime(naming_config.get('date_format', '%Y%m%d')),
             'time': now.strftime(naming_config.get('time_format', '%H%M%S')),
-            'source_name': audio_file.stem,
+            'source_name': source_name,
             'duration': self._format_duration_short(metadata.get('duration', 0)),
             'speakers': str(metadata.get('speaker_count', 0)),
             'language': metadata.get('language', 'en').upper()
@@ -312,7 +323,7 @@ class MarkdownWriter:
             filename = template.format(**variables)
         except KeyError as e:
             self.logger.warning(f"Invalid template variable {e}, using default naming")
-            filename = f"{audio_file.stem}_transcript"
+            filename = f"{source_name}_transcript"
         
         # Add prefix/suffix
         prefix = naming_config.get('custom_prefix', '')
@@ -324,7 +335,7 @@ class MarkdownWriter:
             filename = f"{filename}_{suffix}"
         
         # Handle conflicts and add extension
-        return self._resolve_filename_conflict(f"{filename}.md")
+        return self._resolve_filename_conflict(f"{filename}.md", now)
     
     def _format_duration_short(self, duration_seconds: float) -> str:
         """Format duration in short form (e.g., 5m30s)."""
@@ -339,12 +350,13 @@ class MarkdownWriter:
             minutes = int((duration_seconds % 3600) // 60)
             return f"{hours}h{minutes}m" if minutes > 0 else f"{hours}h"
     
-    def _resolve_filename_conflict(self, filename: str) -> str:
+    def _resolve_filename_conflict(self, filename: str, now: datetime) -> str:
         """
         Handle filename conflicts based on configuration.
         
         Args:
             filename: Proposed filename
+            now: Transcription time
             
         Returns:
             Resolved filename that doesn't conflict
@@ -358,13 +370,12 @@ class MarkdownWriter:
         if not filepath.exists():
             return filename
         
-        name_stem = Path(filename).stem
-        extension = Path(filename).suffix
+        name_stem, extension = os.path.splitext(filename)
         
         if conflict_resolution == 'overwrite':
             return filename
         elif conflict_resolution == 'timestamp':
-            timestamp = datetime.now().strftime('%H%M%S')
+            timestamp = now.strftime('%H%M%S')
             return f"{name_stem}_{timestamp}{extension}"
         else:  # append_number
             counter = 1
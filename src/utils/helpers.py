@@ -6,17 +6,48 @@ retry logic, and other common tasks.
 """
 
 import hashlib
+import os
 import re
+import sys
 import time
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Union, Callable, Any, Optional, Dict, List
-from functools import wraps
+from typing import Union, Callable, Any, Optional, Dict, Iterator, List
+from functools import lru_cache, wraps
 import unicodedata
 import random
 import string
 
 
+# Filesystem types that don't deliver native change notifications reliably
+NETWORK_FILESYSTEMS = frozenset({
+    'nfs', 'nfs4', 'cifs', 'smbfs', 'smb3', 'afs', '9p',
+    'ceph', 'glusterfs', 'fuse.sshfs', 'sshfs', 'davfs', 'fuse.davfs2'
+})
+
+# Path separators, characters invalid on Windows and control characters
+_INVALID_FILENAME_CHARS = '/\\<>:"|?*' + ''.join(map(chr, range(32)))
+
+# Maximum filename length on common filesystems
+MAX_FILENAME_LENGTH = 255
+
+# Dates recognised in audio filenames
+_DATE_PATTERNS = tuple(re.compile(pattern) for pattern in (
+    r'(\d{4}[-_]\d{2}[-_]\d{2})',  # YYYY-MM-DD or YYYY_MM_DD
+    r'(\d{8})',  # YYYYMMDD
+    r'(\d{2}[-_]\d{2}[-_]\d{4})',  # DD-MM-YYYY or DD_MM_YYYY
+))
+
+# Reserved device names on Windows
+_RESERVED_NAMES = frozenset({
+    'CON', 'PRN', 'AUX', 'NUL',
+    'COM1', 'COM2', 'COM3', 'COM4', 'COM5', 
+    'COM6', 'COM7', 'COM8', 'COM9',
+    'LPT1', 'LPT2', 'LPT3', 'LPT4', 'LPT5',
+    'LPT6', 'LPT7', 'LPT8', 'LPT9'
+})
+
+
 def format_duration(seconds: float, format: str = 'human') -> str:
     """
     Format duration in seconds to human-readable string.
@@ -58,8 +89,7 @@ def format_duration(seconds: float, format: str = 'human') -> str:
     elif format == 'ms':
         # MM:SS.mmm format (with milliseconds)
         minutes = int(seconds // 60)
-        secs = seconds % 60
-        return f"{minutes:02d}:{secs:06.3f}"
+        return f"{minutes:02d}:{seconds % 60:06.3f}"
         
     else:
         return str(seconds)
@@ -87,9 +117,15 @@ def format_timestamp(timestamp: Union[float, datetime],
     return dt.strftime(format)
 
 
+@lru_cache(maxsize=8)
+def _sanitize_table(replacement: str) -> Dict[int, str]:
+    """Build the str.translate table used by sanitize_filename."""
+    return str.maketrans(dict.fromkeys(_INVALID_FILENAME_CHARS, replacement))
+
+
 def sanitize_filename(filename: str, 
                      replacement: str = '_',
-                     max_length: int = 255) -> str:
+                     max_length: int = MAX_FILENAME_LENGTH) -> str:
     """
     Sanitize filename for safe file system usage.
     
@@ -101,34 +137,16 @@ def sanitize_filename(filename: str,
     Returns:
         Sanitized filename
     """
-    # Remove path separators
-    filename = filename.replace('/', replacement).replace('\\', replacement)
-    
-    # Remove invalid characters for Windows
-    invalid_chars = '<>:"|?*'
-    for char in invalid_chars:
-        filename = filename.replace(char, replacement)
-        
-    # Remove control characters
-    filename = ''.join(
-        char if ord(char) >= 32 else replacement 
-        for char in filename
-    )
+    # Replace path separators, invalid Windows characters and control
+    # characters in a single pass
+    filename = filename.translate(_sanitize_table(replacement))
     
     # Remove leading/trailing dots and spaces
     filename = filename.strip('. ')
     
     # Handle reserved names (Windows)
-    reserved_names = {
-        'CON', 'PRN', 'AUX', 'NUL',
-        'COM1', 'COM2', 'COM3', 'COM4', 'COM5', 
-        'COM6', 'COM7', 'COM8', 'COM9',
-        'LPT1', 'LPT2', 'LPT3', 'LPT4', 'LPT5',
-        'LPT6', 'LPT7', 'LPT8', 'LPT9'
-    }
-    
     name_part = filename.split('.')[0].upper()
-    if name_part in reserved_names:
+    if name_part in _RESERVED_NAMES:
         filename = replacement + filename
         
     # Normalize unicode
@@ -190,7 +208,8 @@ def retry_with_backoff(
     backoff_factor: float = 2.0,
     max_delay: float = 60.0,
     exceptions: tuple = (Exception,),
-    on_retry: Optional[Callable] = None
+    on_retry: Optional[Callable] = None,
+    jitter: float = 0.0
 ) -> Callable:
     """
     Decorator for retrying functions with exponential backoff.
@@ -202,14 +221,23 @@ def retry_with_backoff(
         max_delay: Maximum delay between retries
         exceptions: Tuple of exceptions to catch and retry
         on_retry: Optional callback function called on each retry
+        jitter: Fraction of each delay added at random, so callers that
+            failed together don't all retry in lockstep
         
     Returns:
         Decorated function
     """
+    # The delay schedule only depends on the arguments, so build it once.
+    # Clamping at each step keeps a long schedule from overflowing
+    delays = []
+    delay = min(initial_delay, max_delay)
+    for _ in range(max_retries):
+        delays.append(delay)
+        delay = min(delay * backoff_factor, max_delay)
+    
     def decorator(func: Callable) -> Callable:
         @wraps(func)
         def wrapper(*args, **kwargs) -> Any:
-            delay = initial_delay
             last_exception = None
             
             for attempt in range(max_retries + 1):
@@ -221,11 +249,14 @@ def retry_with_backoff(
                     if attempt == max_retries:
                         raise
                         
+                    delay = delays[attempt]
+                    if jitter:
+                        delay = min(delay + random.uniform(0, delay * jitter), max_delay)
+                        
                     if on_retry:
                         on_retry(attempt + 1, delay, e)
                         
                     time.sleep(delay)
-                    delay = min(delay * backoff_factor, max_delay)
                     
             # This should never be reached, but just in case
             if last_exception:
@@ -265,7 +296,7 @@ def parse_time_string(time_str: str) -> float:
             return int(minutes) * 60 + float(seconds)
             
     # Parse unit-based format
-    total_seconds = 0
+    total_seconds = 0.0
     
     # Pattern for number followed by unit
     pattern = r'(\d+(?:\.\d+)?)\s*([a-z]+)'
@@ -386,6 +417,24 @@ def chunk_list(lst: List[Any], chunk_size: int) -> List[List[Any]]:
     return [lst[i:i + chunk_size] for i in range(0, len(lst), chunk_size)]
 
 
+def iter_chunks(lst: List[Any], chunk_size: int) -> Iterator[List[Any]]:
+    """
+    Lazily split a list into chunks.
+    
+    Unlike chunk_list, only one chunk exists at a time, so callers that
+    consume the chunks once don't hold every slice in memory.
+    
+    Args:
+        lst: List to chunk
+        chunk_size: Size of each chunk
+        
+    Yields:
+        Successive chunks
+    """
+    for i in range(0, len(lst), chunk_size):
+        yield lst[i:i + chunk_size]
+
+
 def format_file_size(size_bytes: int) -> str:
     """
     Format file size in bytes to human-readable string.
@@ -396,12 +445,13 @@ def format_file_size(size_bytes: int) -> str:
     Returns:
         Formatted size string
     """
+    size = float(size_bytes)
     for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-        if size_bytes < 1024.0:
-            return f"{size_bytes:.2f} {unit}"
-        size_bytes /= 1024.0
+        if size < 1024.0:
+            return f"{size:.2f} {unit}"
+        size /= 1024.0
         
-    return f"{size_bytes:.2f} PB"
+    return f"{size:.2f} PB"
 
 
 def extract_audio_metadata(file_path: Union[str, Path]) -> Dict[str, Any]:
@@ -416,24 +466,23 @@ def extract_audio_metadata(file_path: Union[str, Path]) -> Dict[str, Any]:
     """
     file_path = Path(file_path)
     
+    try:
+        file_stat = file_path.stat()
+    except FileNotFoundError:
+        file_stat = None
+    
     metadata = {
         'filename': file_path.name,
         'stem': file_path.stem,
         'extension': file_path.suffix.lower(),
-        'size_bytes': file_path.stat().st_size if file_path.exists() else 0,
-        'modified_time': file_path.stat().st_mtime if file_path.exists() else None,
+        'size_bytes': file_stat.st_size if file_stat else 0,
+        'modified_time': file_stat.st_mtime if file_stat else None,
         'absolute_path': str(file_path.absolute())
     }
     
     # Try to extract date from filename
-    date_patterns = [
-        r'(\d{4}[-_]\d{2}[-_]\d{2})',  # YYYY-MM-DD or YYYY_MM_DD
-        r'(\d{8})',  # YYYYMMDD
-        r'(\d{2}[-_]\d{2}[-_]\d{4})',  # DD-MM-YYYY or DD_MM_YYYY
-    ]
-    
-    for pattern in date_patterns:
-        match = re.search(pattern, file_path.stem)
+    for pattern in _DATE_PATTERNS:
+        match = pattern.search(file_path.stem)
         if match:
             metadata['extracted_date'] = match.group(1)
             break
@@ -493,4 +542,52 @@ def normalize_path(path: Union[str, Path]) -> Path:
         # If resolve fails, at least make it absolute
         path = path.absolute()
         
-    return path
\ No newline at end of file
+    return path
+
+
+def is_network_path(path: Union[str, Path]) -> bool:
+    """
+    Check whether a path lives on a network filesystem.
+    
+    Native file system events (inotify, ReadDirectoryChangesW) are not
+    delivered for changes made by other hosts on network mounts, so
+    callers use this to decide when to fall back to polling.
+    
+    Args:
+        path: Path to check
+        
+    Returns:
+        True if the path is on a network mount, False otherwise or if
+        the filesystem type cannot be determined
+    """
+    path = os.path.abspath(os.fspath(path))
+    
+    if sys.platform.startswith('linux'):
+        try:
+            with open('/proc/mounts', 'r', encoding='utf-8') as f:
+                mounts = [line.split()[1:3] for line in f if line.strip()]
+        except OSError:
+            return False
+            
+        # The longest mount point containing the path determines its filesystem
+        best_mount = ''
+        best_type = ''
+        for mount_point, fs_type in mounts:
+            mount_point = mount_point.replace('\\040', ' ')
+            prefix = mount_point.rstrip('/') + '/'
+            if (path == mount_point or path.startswith(prefix)) and len(mount_point) > len(best_mount):
+                best_mount = mount_point
+                best_type = fs_type
+                
+        return best_type in NETWORK_FILESYSTEMS
+        
+    if sys.platform == 'win32':
+        import ctypes
+        
+        DRIVE_REMOTE = 4
+        drive = os.path.splitdrive(path)[0]
+        if drive.startswith('\\\\'):
+            return True  # UNC share
+        return ctypes.windll.kernel32.GetDriveTypeW(f"{drive}\\") == DRIVE_REMOTE
+        
+    return False
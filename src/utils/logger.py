@@ -5,15 +5,38 @@ Provides centralized logging setup with file rotation, formatting, and
 different log levels for console and file output.
 """
 
+import atexit
 import logging
 import logging.handlers
+import os
+import queue
 import sys
+import threading
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 import json
 from datetime import datetime
 
 
+# Write buffer for log files, so routine records reach the disk in large
+# writes rather than one write per record
+LOG_WRITE_BUFFER_SIZE = 64 * 1024
+
+# Background listener that owns the output handlers (see setup_logging)
+_listener: Optional[logging.handlers.QueueListener] = None
+
+
+def _stop_listener():
+    """Drain queued records, e.g. at exit before logging.shutdown() closes handlers."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+atexit.register(_stop_listener)
+
+
 class ColoredFormatter(logging.Formatter):
     """Custom formatter with color support for console output."""
     
@@ -74,6 +97,126 @@ class JSONFormatter(logging.Formatter):
         return json.dumps(log_data)
 
 
+class CachedRotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """Rotating file handler that doesn't stat the log file on every record."""
+    
+    # Whether the log path is a regular file (not e.g. /dev/null); refreshed
+    # whenever the file is (re)opened rather than checked per record
+    _is_regular_file = True
+    
+    # Records below this level stay in the write buffer instead of being
+    # flushed one by one; BufferedHandler raises it and flushes per batch
+    flush_level = logging.NOTSET
+    
+    # Bytes in the current log file, counted as records are written. Seeking
+    # the stream to ask for its position would flush the write buffer
+    _bytes_written = 0
+    
+    def _open(self):
+        """Open the log file with a large write buffer and record whether it can be rotated."""
+        self._is_regular_file = (
+            not os.path.exists(self.baseFilename) or os.path.isfile(self.baseFilename)
+        )
+        stream = open(self.baseFilename, self.mode, buffering=LOG_WRITE_BUFFER_SIZE,
+                      encoding=self.encoding, errors=getattr(self, 'errors', None))
+        self._bytes_written = os.fstat(stream.fileno()).st_size
+        return stream
+    
+    def emit(self, record):
+        """Write a record, flushing the stream only for records at flush_level or above."""
+        try:
+            if self.stream is None:
+                self.stream = self._open()
+            msg = self.format(record) + self.terminator
+            size = len(msg.encode(self.stream.encoding, 'replace'))
+            if self._would_overflow(size):
+                self.doRollover()
+                if self.stream is None:
+                    self.stream = self._open()
+            self.stream.write(msg)
+            self._bytes_written += size
+            if record.levelno >= self.flush_level:
+                self.flush()
+        except Exception:
+            self.handleError(record)
+    
+    def shouldRollover(self, record):
+        """Check the byte count against maxBytes without touching the stream."""
+        if self.stream is None:
+            self.stream = self._open()
+        msg = "%s\n" % self.format(record)
+        return self._would_overflow(len(msg.encode(self.stream.encoding, 'replace')))
+    
+    def _would_overflow(self, size: int) -> bool:
+        """Return True if writing size more bytes would take the file past maxBytes."""
+        if self.maxBytes <= 0 or not self._is_regular_file:
+            return False
+        return self._bytes_written + size >= self.maxBytes
+
+
+class BufferedHandler(logging.handlers.MemoryHandler):
+    """Memory handler that batches records into its target and flushes periodically."""
+    
+    def __init__(self, target: logging.Handler, capacity: int, flush_interval: float):
+        """
+        Initialize the buffered handler.
+        
+        Args:
+            target: Handler that receives the buffered records
+            capacity: Number of records buffered before a flush
+            flush_interval: Seconds between periodic flushes (0 disables)
+        """
+        super().__init__(capacity, flushLevel=logging.ERROR, target=target, flushOnClose=True)
+        self.setLevel(target.level)
+        self._closed = threading.Event()
+        
+        # Flush on a timer too, so a quiet log file doesn't lag behind
+        if flush_interval > 0:
+            threading.Thread(
+                target=self._flush_periodically, args=(flush_interval,),
+                name='log-flush', daemon=True
+            ).start()
+            
+    def _flush_periodically(self, interval: float):
+        """Flush buffered records every interval seconds until closed."""
+        while not self._closed.wait(interval):
+            self.flush()
+    
+    def flush(self):
+        """Pass buffered records to the target, then flush it once for the whole batch."""
+        super().flush()
+        if self.target is not None:
+            self.target.flush()
+    
+    def close(self):
+        """Stop the flush timer, flush remaining records and close the target."""
+        self._closed.set()
+        target = self.target
+        super().close()
+        if target is not None:
+            target.close()
+
+
+def _buffered(handler: logging.Handler, log_config: Dict[str, Any]) -> logging.Handler:
+    """
+    Wrap a file handler in a BufferedHandler unless buffering is disabled.
+    
+    Args:
+        handler: File handler to wrap
+        log_config: Logging configuration
+        
+    Returns:
+        The buffered handler, or the original handler if buffer_capacity is 0
+    """
+    capacity = log_config.get('buffer_capacity', 1024)
+    if capacity <= 0:
+        return handler
+    # The batch is flushed as a whole, so skip the per-record stream flush
+    if isinstance(handler, CachedRotatingFileHandler):
+        handler.flush_level = logging.ERROR
+    return BufferedHandler(handler, capacity, log_config.get('flush_interval', 30.0))
+
+
 def setup_logging(config: Optional[Dict[str, Any]] = None) -> None:
     """
     Set up logging configuration.
@@ -81,6 +224,8 @@ def setup_logging(config: Optional[Dict[str, Any]] = None) -> None:
     Args:
         config: Optional configuration dictionary
     """
+    global _listener
+    
     if config is None:
         config = {}
         
@@ -99,8 +244,17 @@ def setup_logging(config: Optional[Dict[str, Any]] = None) -> None:
     root_logger = logging.getLogger()
     root_logger.setLevel(logging.DEBUG)  # Capture all, filter in handlers
     
-    # Remove existing handlers
+    # Remove existing handlers, then stop the previous listener and close
+    # its outputs so buffered records are written before the new ones
     root_logger.handlers.clear()
+    previous = _listener
+    _stop_listener()
+    if previous is not None:
+        for handler in previous.handlers:
+            handler.close()
+        
+    # Handlers that do the actual output, run on the listener thread
+    handlers: List[logging.Handler] = []
     
     # Console handler
     console_handler = logging.StreamHandler(sys.stdout)
@@ -121,11 +275,11 @@ def setup_logging(config: Optional[Dict[str, Any]] = None) -> None:
         console_formatter = logging.Formatter(console_format)
         
     console_handler.setFormatter(console_formatter)
-    root_logger.addHandler(console_handler)
+    handlers.append(console_handler)
     
     # File handler with rotation
     log_file = log_dir / 'obsidian_scribe.log'
-    file_handler = logging.handlers.RotatingFileHandler(
+    file_handler = CachedRotatingFileHandler(
         log_file,
         maxBytes=log_config.get('max_bytes', 10 * 1024 * 1024),  # 10MB default
         backupCount=log_config.get('backup_count', 5)
@@ -139,30 +293,39 @@ def setup_logging(config: Optional[Dict[str, Any]] = None) -> None:
     )
     file_formatter = logging.Formatter(file_format)
     file_handler.setFormatter(file_formatter)
-    root_logger.addHandler(file_handler)
+    
+    # Batch file writes; ERROR and above still flush immediately
+    handlers.append(_buffered(file_handler, log_config))
     
     # JSON file handler for structured logs (optional)
     if log_config.get('enable_json_logs', False):
         json_file = log_dir / 'obsidian_scribe.json'
-        json_handler = logging.handlers.RotatingFileHandler(
+        json_handler = CachedRotatingFileHandler(
             json_file,
             maxBytes=log_config.get('max_bytes', 10 * 1024 * 1024),
             backupCount=log_config.get('backup_count', 5)
         )
         json_handler.setLevel(logging.DEBUG)
         json_handler.setFormatter(JSONFormatter())
-        root_logger.addHandler(json_handler)
+        handlers.append(_buffered(json_handler, log_config))
         
     # Error file handler (errors and above)
     error_file = log_dir / 'obsidian_scribe_errors.log'
-    error_handler = logging.handlers.RotatingFileHandler(
+    error_handler = CachedRotatingFileHandler(
         error_file,
         maxBytes=log_config.get('max_bytes', 10 * 1024 * 1024),
         backupCount=log_config.get('backup_count', 5)
     )
     error_handler.setLevel(logging.ERROR)
     error_handler.setFormatter(file_formatter)
-    root_logger.addHandler(error_handler)
+    handlers.append(error_handler)
+    
+    # Log calls only enqueue the record; console and file I/O happens on the
+    # listener's background thread
+    log_queue: 'queue.SimpleQueue[logging.LogRecord]' = queue.SimpleQueue()
+    root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    _listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _listener.start()
     
     # Set levels for specific loggers
     logger_levels = log_config.get('logger_levels', {})
@@ -7,6 +7,7 @@ configuration values, and audio files.
 
 import os
 import re
+import stat
 from pathlib import Path
 from typing import Dict, Any, List, Optional, Union
 from urllib.parse import urlparse
@@ -15,6 +16,25 @@ import yaml
 
 from .exceptions import ValidationError, AudioFormatError, ConfigurationError
 
+# Default audio formats accepted by validate_audio_file
+SUPPORTED_AUDIO_FORMATS = frozenset({
+    '.wav', '.mp3', '.m4a', '.flac', '.ogg', '.wma', '.aac', '.opus'
+})
+
+# Types accepted wherever a config value must be a number
+_NUMERIC = (int, float)
+
+# Schema type names understood by _check_type
+_TYPE_MAP = {
+    'string': str,
+    'integer': int,
+    'number': _NUMERIC,
+    'boolean': bool,
+    'array': list,
+    'dict': dict,
+    'null': type(None)
+}
+
 
 def validate_audio_file(file_path: Union[str, Path], 
                        check_exists: bool = True,
@@ -40,8 +60,16 @@ def validate_audio_file(file_path: Union[str, Path],
     """
     file_path = Path(file_path)
     
+    # One stat covers existence, type and size
+    file_stat = None
+    if check_exists:
+        try:
+            file_stat = file_path.stat()
+        except FileNotFoundError:
+            pass
+            
     # Check if file exists
-    if check_exists and not file_path.exists():
+    if check_exists and file_stat is None:
         raise ValidationError(
             f"Audio file does not exist: {file_path}",
             field='file_path',
@@ -49,7 +77,7 @@ def validate_audio_file(file_path: Union[str, Path],
         )
         
     # Check if it's a file (not directory)
-    if check_exists and not file_path.is_file():
+    if check_exists and not stat.S_ISREG(file_stat.st_mode):
         raise ValidationError(
             f"Path is not a file: {file_path}",
             field='file_path',
@@ -58,19 +86,18 @@ def validate_audio_file(file_path: Union[str, Path],
         
     # Check file extension
     if supported_formats is None:
-        supported_formats = ['.wav', '.mp3', '.m4a', '.flac', '.ogg', 
-                           '.wma', '.aac', '.opus']
+        supported_formats = SUPPORTED_AUDIO_FORMATS
                            
     if file_path.suffix.lower() not in supported_formats:
         raise AudioFormatError(
             str(file_path),
             format=file_path.suffix,
-            supported_formats=supported_formats
+            supported_formats=sorted(supported_formats)
         )
         
     # Check file size
     if check_exists and check_size:
-        file_size_mb = file_path.stat().st_size / (1024 * 1024)
+        file_size_mb = file_stat.st_size / (1024 * 1024)
         
         if file_size_mb > max_size_mb:
             raise ValidationError(
@@ -187,17 +214,10 @@ def _validate_against_schema(config: Dict, schema: Dict, path: str = ""):
 
 def _check_type(value: Any, expected_type: str) -> bool:
     """Check if value matches expected type."""
-    type_map = {
-        'string': str,
-        'integer': int,
-        'number': (int, float),
-        'boolean': bool,
-        'array': list,
-        'dict': dict,
-        'null': type(None)
-    }
-    
-    expected = type_map.get(expected_type)
+    expected = _TYPE_MAP.get(expected_type)
+    # bool is a subclass of int, but true/false is never a valid number
+    if isinstance(value, bool) and expected_type in ('integer', 'number'):
+        return False
     if expected:
         return isinstance(value, expected)
     return True
@@ -219,7 +239,7 @@ def _validate_audio_config(audio: Dict[str, Any]):
     # Validate chunk settings
     if 'chunk_duration' in audio:
         duration = audio['chunk_duration']
-        if not isinstance(duration, (int, float)) or duration <= 0:
+        if not isinstance(duration, _NUMERIC) or isinstance(duration, bool) or duration <= 0:
             raise ConfigurationError(
                 "audio.chunk_duration must be positive number",
                 config_key="audio.chunk_duration",
@@ -229,7 +249,7 @@ def _validate_audio_config(audio: Dict[str, Any]):
     # Validate file size limit
     if 'max_file_size_mb' in audio:
         size = audio['max_file_size_mb']
-        if not isinstance(size, (int, float)) or size <= 0:
+        if not isinstance(size, _NUMERIC) or isinstance(size, bool) or size <= 0:
             raise ConfigurationError(
                 "audio.max_file_size_mb must be positive number",
                 config_key="audio.max_file_size_mb",
@@ -1,17 +1,37 @@
 """
 File system event handler for audio files.
 
-Handles file creation and modification events for audio files.
+Handles file creation, modification, close and move events for audio files.
 """
 
+import fnmatch
 import logging
 import os
-from typing import Dict, Set
+import platform
+import re
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Optional, Set, Tuple
 
-from watchdog.events import FileSystemEventHandler, FileCreatedEvent, FileModifiedEvent
+from watchdog.events import (
+    FileSystemEventHandler, FileClosedEvent, FileCreatedEvent, FileMovedEvent
+)
 
 from .queue_manager import QueueManager
 
+# Dropping "<audio file>.unlock" into the watch folder clears that file from
+# the processing set so it is picked up again without restarting
+UNLOCK_SUFFIX = '.unlock'
+
+# Maximum number of in-progress file sizes remembered for readiness checks
+MAX_TRACKED_SIZES = 4096
+
+# Seconds a created file must stay unchanged, with no close event, before it
+# is treated as moved in from outside the watch folder. Much longer than the
+# debounce window, so a writer that pauses isn't mistaken for a finished file
+CREATED_SETTLE_SECONDS = 10.0
+
 
 class AudioFileHandler(FileSystemEventHandler):
     """Handler for audio file system events."""
@@ -27,10 +47,50 @@ class AudioFileHandler(FileSystemEventHandler):
         self.queue_manager = queue_manager
         self.config = config
         self.logger = logging.getLogger(__name__)
-        self.file_extensions = [ext.lower() for ext in config.get('file_extensions', ['.wav', '.mp3'])]
+        self.file_extensions = frozenset(ext.lower() for ext in config.get('file_extensions', ['.wav', '.mp3']))
         self.ignore_patterns = config.get('ignore_patterns', ['.*', '~*'])
+        # Compile ignore patterns once into a single alternation so each event
+        # is one C-level match. Patterns without a wildcard match anywhere in
+        # the filename
+        ignore_globs = [pattern if '*' in pattern else f'*{pattern}*' for pattern in self.ignore_patterns]
+        self._ignore_regex = re.compile(
+            '|'.join(f'(?:{fnmatch.translate(glob)})' for glob in ignore_globs)
+        ) if ignore_globs else None
         self._processing_files: Set[str] = set()
-        self._file_sizes: Dict[str, int] = {}
+        # Sizes of files still being written. Bounded so files that never
+        # settle (e.g. deleted partial downloads) can't grow it forever
+        self._file_sizes: 'OrderedDict[str, int]' = OrderedDict()
+        
+        # Repeated modification events for the same file within this window
+        # are dropped before any stat calls are made
+        self._debounce_seconds = config.get('debounce_seconds', 0.5)
+        self._last_event: Dict[str, float] = {}
+        
+        # The native Linux observer (inotify) reports IN_CLOSE_WRITE once the
+        # writer closes the file, which is exactly the "fully written" signal.
+        # Other backends and the polling observer fall back to size polling
+        self._close_events = platform.system() == 'Linux' and not config.get('use_polling', False)
+        
+        # Event types the observer should deliver. With close events available
+        # the inotify watch is narrowed to IN_CLOSE_WRITE, IN_CREATE and
+        # IN_MOVED_*, so the kernel never queues the IN_MODIFY storm a large
+        # copy produces. None delivers everything
+        self.event_filter = [
+            FileClosedEvent, FileCreatedEvent, FileMovedEvent
+        ] if self._close_events else None
+        
+        # Files reported as created that haven't been closed yet, mapped to
+        # when their (size, mtime) was last seen changing. inotify reports a
+        # file moved in from outside the watch folder as a create with no
+        # close or move event after it, so these are queued once unchanged
+        # for the settle time, unless a close event claims them first
+        self._pending_creates: 'OrderedDict[str, Tuple[float, Optional[Tuple[int, int]]]]' = OrderedDict()
+        self._created_settle_seconds = config.get('created_settle_seconds', CREATED_SETTLE_SECONDS)
+        
+        # Events arrive on the observer thread, pending creates are checked
+        # on the watcher's queue thread and the processor clears finished
+        # files, so the processing set and pending state share one lock
+        self._lock = threading.Lock()
         
     def _should_ignore(self, file_path: str) -> bool:
         """
@@ -45,15 +105,7 @@ class AudioFileHandler(FileSystemEventHandler):
         filename = os.path.basename(file_path)
         
         # Check ignore patterns
-        for pattern in self.ignore_patterns:
-            if pattern.startswith('*') and filename.endswith(pattern[1:]):
-                return True
-            elif pattern.endswith('*') and filename.startswith(pattern[:-1]):
-                return True
-            elif pattern in filename:
-                return True
-                
-        return False
+        return bool(self._ignore_regex and self._ignore_regex.match(filename))
         
     def _is_valid_audio_file(self, file_path: str) -> bool:
         """
@@ -75,6 +127,29 @@ class AudioFileHandler(FileSystemEventHandler):
         file_ext = os.path.splitext(file_path)[1].lower()
         return file_ext in self.file_extensions
         
+    def _is_valid_audio_entry(self, entry: os.DirEntry) -> bool:
+        """
+        Check if a directory entry is a valid audio file.
+        
+        Same checks as _is_valid_audio_file, but uses the cached file type
+        from os.scandir instead of a separate stat.
+        
+        Args:
+            entry: Directory entry from os.scandir
+            
+        Returns:
+            True if entry is valid audio file
+        """
+        if not entry.is_file():
+            return False
+            
+        if self._should_ignore(entry.name):
+            return False
+            
+        # Check file extension
+        file_ext = os.path.splitext(entry.name)[1].lower()
+        return file_ext in self.file_extensions
+        
     def _is_file_ready(self, file_path: str) -> bool:
         """
         Check if a file is fully written and ready for processing.
@@ -94,43 +169,79 @@ class AudioFileHandler(FileSystemEventHandler):
                     # Size hasn't changed, file is likely ready
                     return True
                     
-            self._file_sizes[file_path] = current_size
+            self._remember_size(file_path, current_size)
             return False
             
         except (OSError, IOError):
             return False
             
+    # watchdog dispatches each event type to its own on_* method, so the
+    # handlers below only need to filter out directory events
     def on_created(self, event):
         """Handle file creation events."""
-        if isinstance(event, FileCreatedEvent) and not event.is_directory:
-            self._handle_file(event.src_path)
+        if not event.is_directory:
+            if event.src_path.endswith(UNLOCK_SUFFIX):
+                self._handle_unlock(event.src_path)
+            elif not self._close_events:
+                self._handle_file(event.src_path)
+            elif self._is_audio_name(event.src_path):
+                with self._lock:
+                    self._pending_creates[event.src_path] = (time.monotonic(), None)
+                    if len(self._pending_creates) > MAX_TRACKED_SIZES:
+                        self._pending_creates.popitem(last=False)
             
     def on_modified(self, event):
         """Handle file modification events."""
-        if isinstance(event, FileModifiedEvent) and not event.is_directory:
+        if not event.is_directory and not self._close_events:
             self._handle_file(event.src_path)
             
-    def _handle_file(self, file_path: str):
+    def on_closed(self, event):
+        """Handle file close-after-write events (inotify only)."""
+        if not event.is_directory:
+            with self._lock:
+                self._pending_creates.pop(event.src_path, None)
+            self._handle_file(event.src_path, ready=True)
+            
+    def on_moved(self, event):
+        """Handle files renamed or moved into the watch folder."""
+        # A rename is atomic, so the destination is already fully written
+        if not event.is_directory:
+            self._handle_file(event.dest_path, ready=True)
+            
+    def _handle_file(self, file_path: str, ready: bool = False):
         """
         Handle a potential audio file.
         
         Args:
             file_path: Path to the file
+            ready: True if the event already guarantees the file is fully written
         """
-        if not self._is_valid_audio_file(file_path):
-            return
-            
-        # Skip if already processing
-        if file_path in self._processing_files:
-            return
-            
-        # Check if file is ready (fully written)
-        if not self._is_file_ready(file_path):
-            self.logger.debug(f"File not ready yet: {file_path}")
-            return
+        # Check and claim the file under the lock, so two threads reporting
+        # the same file can't both queue it
+        with self._lock:
+            # Skip if already processing
+            if file_path in self._processing_files:
+                return
+                
+            # Coalesce bursts of events (e.g. during a large copy)
+            if not ready:
+                now = time.monotonic()
+                if now - self._last_event.get(file_path, 0.0) < self._debounce_seconds:
+                    return
+                self._last_event[file_path] = now
+                
+            if not self._is_valid_audio_file(file_path):
+                return
+                
+            # Check if file is ready (fully written)
+            if not ready and not self._is_file_ready(file_path):
+                self.logger.debug(f"File not ready yet: {file_path}")
+                return
+                
+            # Add to processing set and clean up file size tracking
+            self._processing_files.add(file_path)
+            self._file_sizes.pop(file_path, None)
             
-        # Add to processing set and queue
-        self._processing_files.add(file_path)
         self.logger.info(f"New audio file detected: {file_path}")
         
         # Add to queue with priority based on file age
@@ -140,17 +251,123 @@ class AudioFileHandler(FileSystemEventHandler):
             self.queue_manager.add_file(file_path, priority=priority)
         except Exception as e:
             self.logger.error(f"Error adding file to queue: {e}")
-            self._processing_files.discard(file_path)
+            with self._lock:
+                self._processing_files.discard(file_path)
+                
+    def check_pending_creates(self):
+        """
+        Queue created files that settled without a close event.
+        
+        Called periodically from the watcher's queue thread. A pending file
+        is queued once its size and modification time have stayed the same
+        for the settle time; a close event in the meantime takes it off the
+        pending list and queues it straight away.
+        """
+        now = time.monotonic()
+        with self._lock:
+            pending = list(self._pending_creates.items())
+            
+        settled = []
+        for file_path, (since, signature) in pending:
+            try:
+                file_stat = os.stat(file_path)
+                current: Optional[Tuple[int, int]] = (file_stat.st_size, file_stat.st_mtime_ns)
+            except OSError:
+                current = None
+                
+            with self._lock:
+                # Claimed by a close event while we were looking
+                if file_path not in self._pending_creates:
+                    continue
+                    
+                # Gone, or already queued some other way
+                if current is None or file_path in self._processing_files:
+                    del self._pending_creates[file_path]
+                    continue
+                    
+                # Still being written; restart the settle time
+                if current != signature:
+                    self._pending_creates[file_path] = (now, current)
+                    continue
+                    
+                if now - since < self._created_settle_seconds:
+                    continue
+                del self._pending_creates[file_path]
+            settled.append(file_path)
+            
+        for file_path in settled:
+            self.logger.debug(f"Created file settled without a close event: {file_path}")
+            self._handle_file(file_path, ready=True)
+            
+    def _is_audio_name(self, file_path: str) -> bool:
+        """
+        Check a path's name against the ignore patterns and extensions.
         
-        # Clean up file size tracking
-        if file_path in self._file_sizes:
-            del self._file_sizes[file_path]
+        Args:
+            file_path: Path to the file
+            
+        Returns:
+            True if the name looks like an audio file to process
+        """
+        if self._should_ignore(file_path):
+            return False
+        return os.path.splitext(file_path)[1].lower() in self.file_extensions
+        
+    def _remember_size(self, file_path: str, size: int):
+        """
+        Record the last seen size of a file, evicting the oldest entry when full.
+        
+        Args:
+            file_path: Path to the file
+            size: File size in bytes
+        """
+        self._file_sizes[file_path] = size
+        self._file_sizes.move_to_end(file_path)
+        if len(self._file_sizes) > MAX_TRACKED_SIZES:
+            self._file_sizes.popitem(last=False)
+            
+    def prune_event_times(self, max_age: float = 60.0):
+        """
+        Forget debounce timestamps older than max_age seconds.
+        
+        Args:
+            max_age: Age in seconds after which an entry is dropped
+        """
+        cutoff = time.monotonic() - max_age
+        for file_path, seen in list(self._last_event.items()):
+            if seen < cutoff:
+                self._last_event.pop(file_path, None)
             
     def clear_processing_file(self, file_path: str):
         """
         Remove a file from the processing set.
         
+        The queue manager forgets the file too, otherwise it would refuse to
+        queue the same path again.
+        
         Args:
             file_path: Path to the file
         """
-        self._processing_files.discard(file_path)
\ No newline at end of file
+        with self._lock:
+            self._processing_files.discard(file_path)
+        self.queue_manager.discard(file_path)
+            
+    def _handle_unlock(self, marker_path: str):
+        """
+        Clear a file from the processing set in response to an unlock marker.
+        
+        Args:
+            marker_path: Path to the "<audio file>.unlock" marker
+        """
+        file_path = marker_path[:-len(UNLOCK_SUFFIX)]
+        
+        try:
+            os.remove(marker_path)
+        except OSError as e:
+            self.logger.warning(f"Could not remove unlock marker {marker_path}: {e}")
+            
+        self.clear_processing_file(file_path)
+        self.logger.info(f"Cleared file from processing set: {file_path}")
+        
+        # The file already exists on disk, so it is ready to be queued again
+        self._handle_file(file_path, ready=True)
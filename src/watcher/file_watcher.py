@@ -5,16 +5,21 @@ Monitors a directory for new audio files and queues them for processing.
 """
 
 import logging
+import os
 import time
 from pathlib import Path
 from threading import Thread, Event
 from typing import Dict, Optional, Any
 
 from watchdog.observers import Observer
+from watchdog.observers.polling import PollingObserver
 
 from .event_handler import AudioFileHandler
 from .queue_manager import QueueManager
 
+# Maximum number of files handed to the processor in one batch
+QUEUE_BATCH_SIZE = 64
+
 
 class FileWatcher:
     """Main file watcher class that monitors directories for audio files."""
@@ -61,10 +66,20 @@ class FileWatcher:
         self._running = True
         self._stop_event.clear()
         
-        # Start the observer
-        self._observer = Observer()
+        # Start the observer. The native observer (inotify/FSEvents/
+        # ReadDirectoryChangesW) is idle until something changes; polling
+        # is only used where native events aren't delivered, e.g. network mounts
+        if self.config.get('use_polling', False):
+            poll_interval = self.config.get('poll_interval', 30.0)
+            self.logger.info(f"Using polling observer (interval: {poll_interval}s)")
+            self._observer = PollingObserver(timeout=poll_interval)
+        else:
+            self._observer = Observer()
         self._handler = AudioFileHandler(self.queue_manager, self.config)
-        self._observer.schedule(self._handler, str(self.watch_folder), recursive=False)
+        self._observer.schedule(
+            self._handler, str(self.watch_folder), recursive=False,
+            event_filter=self._handler.event_filter
+        )
         self._observer.start()
         
         # Start queue processing thread
@@ -109,14 +124,15 @@ class FileWatcher:
         count = 0
         
         try:
-            for file_path in self.watch_folder.iterdir():
-                if file_path.is_file():
-                    full_path = str(file_path)
-                    if handler._is_valid_audio_file(full_path):
+            # DirEntry caches the file type from the directory read, so each
+            # candidate costs at most one stat instead of two or three
+            with os.scandir(self.watch_folder) as entries:
+                for entry in entries:
+                    if handler._is_valid_audio_entry(entry):
                         # For existing files, assume they are ready
                         # Mark the file size as stable by setting it twice
-                        file_size = file_path.stat().st_size
-                        handler._file_sizes[full_path] = file_size
+                        full_path = entry.path
+                        handler._remember_size(full_path, entry.stat().st_size)
                         
                         self.logger.info(f"Found existing audio file: {full_path}")
                         self.queue_manager.add_file(full_path)
@@ -135,17 +151,28 @@ class FileWatcher:
             try:
                 # Wait for a file with timeout
                 if not self._stop_event.is_set():
-                    file_path = self.queue_manager.get_next_file(timeout=1.0)
+                    # Drain bursts (e.g. the initial scan) in batches so the
+                    # queue lock and processor hand-off are paid once per batch
+                    file_paths = self.queue_manager.get_next_files(QUEUE_BATCH_SIZE, timeout=1.0)
+                    
+                    # Pick up files moved in from outside the watch folder,
+                    # which inotify reports without a close event
+                    self._handler.check_pending_creates()
                     
-                    if file_path:
-                        self.logger.info(f"Processing file from queue: {file_path}")
+                    if file_paths:
+                        for file_path in file_paths:
+                            self.logger.info(f"Processing file from queue: {file_path}")
                         try:
-                            # Add file to processor queue
-                            self.processor.add_file(file_path)
+                            # Add files to processor queue
+                            self.processor.add_files(file_paths)
                         except Exception as e:
-                            self.logger.error(f"Error adding file to processor: {e}")
+                            self.logger.error(f"Error adding files to processor: {e}")
                             # Mark as failed for potential retry
-                            self.queue_manager.mark_failed(file_path)
+                            for file_path in file_paths:
+                                self.queue_manager.mark_failed(file_path)
+                    else:
+                        # Idle tick: drop stale debounce entries
+                        self._handler.prune_event_times()
                             
             except Exception as e:
                 self.logger.error(f"Error in queue processing: {e}")
@@ -8,7 +8,7 @@ import logging
 import heapq
 from queue import Queue, Empty, PriorityQueue
 from threading import Lock
-from typing import Dict, Optional, Set, Tuple, Any
+from typing import Dict, List, Optional, Set, Tuple, Any
 from dataclasses import dataclass, field
 from datetime import datetime
 
@@ -69,6 +69,36 @@ class QueueManager:
         except Empty:
             return None
             
+    def get_next_files(self, max_files: int, timeout: Optional[float] = None) -> List[str]:
+        """
+        Get up to max_files files from the queue in one call.
+        
+        Blocks for the first file only; anything else already queued is
+        drained without waiting.
+        
+        Args:
+            max_files: Maximum number of files to return
+            timeout: Timeout in seconds for the first file
+            
+        Returns:
+            List of file paths (empty if the queue stayed empty)
+        """
+        try:
+            items = [self._queue.get(timeout=timeout)]
+        except Empty:
+            return []
+            
+        while len(items) < max_files:
+            try:
+                items.append(self._queue.get_nowait())
+            except Empty:
+                break
+                
+        file_paths = [item.file_path for item in items]
+        with self._lock:
+            self._processing.update(file_paths)
+        return file_paths
+        
     def mark_completed(self, file_path: str):
         """
         Mark a file as completed.
@@ -152,6 +182,18 @@ class QueueManager:
         with self._lock:
             return file_path in self._completed
             
+    def discard(self, file_path: str):
+        """
+        Forget a file entirely, so it can be queued again.
+        
+        Args:
+            file_path: Path to the file
+        """
+        with self._lock:
+            self._processing.discard(file_path)
+            self._completed.discard(file_path)
+            self._failed.pop(file_path, None)
+            
     def clear_completed(self):
         """Clear the completed files set."""
         with self._lock:
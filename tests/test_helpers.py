@@ -0,0 +1,94 @@
+"""
+Tests for helper utilities.
+"""
+
+import pytest
+from unittest.mock import patch
+
+from src.utils.helpers import chunk_list, iter_chunks, retry_with_backoff
+
+
+class TestRetryWithBackoff:
+    """Test the retry_with_backoff decorator."""
+    
+    def test_retry_with_backoff_delays(self):
+        """Test retry delay schedule and jitter."""
+        delays = []
+        
+        @retry_with_backoff(max_retries=4, initial_delay=0.01, backoff_factor=2.0,
+                            max_delay=0.03, on_retry=lambda attempt, delay, e: delays.append(delay))
+        def always_fails():
+            raise RuntimeError("Permanent error")
+        
+        with pytest.raises(RuntimeError):
+            always_fails()
+        assert delays == pytest.approx([0.01, 0.02, 0.03, 0.03])
+        
+        # Jitter only ever lengthens a delay, by at most the given fraction
+        delays.clear()
+        
+        @retry_with_backoff(max_retries=3, initial_delay=0.01, jitter=0.5,
+                            on_retry=lambda attempt, delay, e: delays.append(delay))
+        def jittery():
+            raise RuntimeError("Permanent error")
+        
+        with pytest.raises(RuntimeError):
+            jittery()
+        for delay, base in zip(delays, [0.01, 0.02, 0.04]):
+            assert base <= delay <= base * 1.5
+        
+        # Jitter never takes a delay past max_delay
+        delays.clear()
+        
+        @retry_with_backoff(max_retries=3, initial_delay=0.01, max_delay=0.01, jitter=1.0,
+                            on_retry=lambda attempt, delay, e: delays.append(delay))
+        def capped():
+            raise RuntimeError("Permanent error")
+        
+        with pytest.raises(RuntimeError):
+            capped()
+        assert delays == pytest.approx([0.01, 0.01, 0.01])
+    
+    def test_retry_with_backoff_long_schedule(self):
+        """Test that many retries don't overflow the delay calculation."""
+        delays = []
+        
+        @retry_with_backoff(max_retries=2000, initial_delay=1.0, max_delay=60.0,
+                            on_retry=lambda attempt, delay, e: delays.append(delay))
+        def fails_twice():
+            if len(delays) < 2:
+                raise RuntimeError("Temporary error")
+            return "success"
+        
+        with patch('time.sleep'):
+            assert fails_twice() == "success"
+        assert delays == [1.0, 2.0]
+    
+    def test_retry_with_backoff_succeeds(self):
+        """Test that the wrapped function's result is returned after retries."""
+        calls = []
+        
+        @retry_with_backoff(max_retries=3, initial_delay=0.0)
+        def flaky():
+            calls.append(1)
+            if len(calls) < 3:
+                raise ValueError("Temporary error")
+            return "success"
+        
+        assert flaky() == "success"
+        assert len(calls) == 3
+
+
+class TestChunking:
+    """Test list chunking helpers."""
+    
+    def test_iter_chunks(self):
+        """Test lazy list chunking."""
+        lst = list(range(10))
+        
+        chunks = iter_chunks(lst, 3)
+        assert next(chunks) == [0, 1, 2]
+        assert list(chunks) == [[3, 4, 5], [6, 7, 8], [9]]
+        
+        # Matches chunk_list
+        assert list(iter_chunks(lst, 4)) == chunk_list(lst, 4)
@@ -0,0 +1,85 @@
+"""
+Tests for the logging handlers.
+"""
+
+import logging
+import pytest
+
+from src.utils.logger import BufferedHandler, CachedRotatingFileHandler
+
+
+def _record(message, level=logging.INFO):
+    """Build a log record without going through a logger."""
+    return logging.makeLogRecord({'msg': message, 'levelno': level, 'levelname': logging.getLevelName(level)})
+
+
+@pytest.fixture
+def log_file(temp_dir):
+    """Path of a log file inside the temporary directory."""
+    return temp_dir / 'scribe.log'
+
+
+class TestCachedRotatingFileHandler:
+    """Test CachedRotatingFileHandler buffering and rotation."""
+    
+    @pytest.mark.parametrize('max_bytes', [0, 1024 * 1024])
+    def test_records_below_flush_level_stay_buffered(self, log_file, max_bytes):
+        """Records below flush_level aren't written until a flush, with or without rotation."""
+        handler = CachedRotatingFileHandler(str(log_file), maxBytes=max_bytes, backupCount=1)
+        handler.setFormatter(logging.Formatter('%(message)s'))
+        handler.flush_level = logging.ERROR
+        
+        for i in range(5):
+            handler.emit(_record(f"message {i}"))
+        assert log_file.stat().st_size == 0
+        
+        handler.emit(_record("failure", logging.ERROR))
+        assert log_file.read_text().splitlines() == [f"message {i}" for i in range(5)] + ["failure"]
+        handler.close()
+        
+    def test_rotates_on_byte_count(self, log_file):
+        """The file rolls over before it would grow past maxBytes."""
+        handler = CachedRotatingFileHandler(str(log_file), maxBytes=100, backupCount=2, encoding='utf-8')
+        handler.setFormatter(logging.Formatter('%(message)s'))
+        
+        # 10 bytes per record including the newline and a two-byte character
+        for i in range(25):
+            handler.emit(_record(f"héllo {i:02d}"))
+        handler.close()
+        
+        assert log_file.stat().st_size == 70
+        assert (log_file.parent / 'scribe.log.1').stat().st_size == 90
+        assert (log_file.parent / 'scribe.log.2').stat().st_size == 90
+        
+    def test_counts_existing_file(self, log_file):
+        """Bytes already in the file count towards the rotation limit."""
+        log_file.write_text('x' * 95)
+        handler = CachedRotatingFileHandler(str(log_file), maxBytes=100, backupCount=1)
+        handler.setFormatter(logging.Formatter('%(message)s'))
+        
+        handler.emit(_record("next"))
+        handler.close()
+        
+        assert log_file.read_text() == "next\n"
+        assert (log_file.parent / 'scribe.log.1').read_text() == 'x' * 95
+
+
+class TestBufferedHandler:
+    """Test BufferedHandler batching."""
+    
+    def test_flush_writes_batch(self, log_file):
+        """Buffered records reach the file on flush and on close."""
+        target = CachedRotatingFileHandler(str(log_file), maxBytes=1024 * 1024, backupCount=1)
+        target.setFormatter(logging.Formatter('%(message)s'))
+        target.flush_level = logging.ERROR
+        handler = BufferedHandler(target, capacity=100, flush_interval=0)
+        
+        handler.handle(_record("first"))
+        assert log_file.stat().st_size == 0
+        
+        handler.flush()
+        assert log_file.read_text() == "first\n"
+        
+        handler.handle(_record("second"))
+        handler.close()
+        assert log_file.read_text() == "first\nsecond\n"
@@ -0,0 +1,240 @@
+"""
+Tests for audio processing orchestration.
+"""
+
+import sys
+import threading
+import time
+import pytest
+from unittest.mock import Mock, patch
+
+from watchdog.events import FileClosedEvent
+
+from src.watcher.event_handler import AudioFileHandler
+from src.watcher.file_watcher import FileWatcher
+
+
+@pytest.fixture
+def processor_config(temp_dir):
+    """Create a minimal processor configuration."""
+    config = {
+        'paths': {
+            'audio_folder': str(temp_dir / 'audio'),
+            'transcript_folder': str(temp_dir / 'transcripts'),
+            'archive_folder': str(temp_dir / 'archive'),
+            'temp_folder': str(temp_dir / 'temp')
+        },
+        'processing': {
+            'concurrent_files': 1,
+            'retry_failed': True,
+            'retry_delay': 0,
+            'max_retries': 2,
+            'transcribe_workers': 1
+        },
+        'transcription': {'chunk_size_mb': 1},
+        'diarization': {'enabled': False}
+    }
+    (temp_dir / 'audio').mkdir()
+    return config
+
+
+@pytest.fixture
+def processor(processor_config):
+    """Create an AudioProcessor with its conversion and model components mocked."""
+    # The diarizer, transcriber, converter and chunker wrap pyannote, Whisper
+    # and ffmpeg; replace them so only the orchestration logic is exercised
+    components = {
+        f'src.audio.{name}': Mock()
+        for name in ('diarizer', 'transcriber', 'converter', 'chunker')
+    }
+    with patch.dict(sys.modules, components):
+        sys.modules.pop('src.audio.processor', None)
+        from src.audio.processor import AudioProcessor
+        
+        audio_processor = AudioProcessor(processor_config)
+        audio_processor.file_manager = Mock()
+        audio_processor.archive_manager = Mock()
+        audio_processor.transcript_generator = Mock()
+        audio_processor.converter.needs_conversion.return_value = False
+        yield audio_processor
+        audio_processor.stop()
+
+
+def _file_info(file_path, size=2 * 1024 * 1024):
+    """Build a get_file_info() result for a file that needs chunking."""
+    return {'name': file_path.name, 'size': size, 'size_mb': size / (1024 * 1024), 'modified': 0.0}
+
+
+class TestChunkedTranscription:
+    """Test transcription of chunked files."""
+    
+    def _chunk_files(self, temp_dir, count):
+        """Yield chunk files, creating each one as it is requested."""
+        for i in range(count):
+            chunk = temp_dir / f'chunk_{i}.wav'
+            chunk.write_bytes(b'\0' * 16)
+            yield str(chunk)
+    
+    def test_generator_chunks_transcribed_and_removed(self, processor, temp_dir):
+        """Chunks produced by a generator are all transcribed, offset and removed."""
+        audio_file = temp_dir / 'audio' / 'long.wav'
+        processor.chunker.chunk_audio.return_value = self._chunk_files(temp_dir, 3)
+        processor.transcriber.transcribe.side_effect = lambda chunk: {
+            'text': chunk, 'segments': [{'start': 0.0, 'end': 10.0}], 'language': 'en'
+        }
+        
+        result = processor._process_file(str(audio_file), _file_info(audio_file))
+        
+        assert result.success
+        segments = result.transcription_result['segments']
+        assert [segment['start'] for segment in segments] == [0.0, 10.0, 20.0]
+        assert not list(temp_dir.glob('chunk_*.wav'))
+    
+    def test_failed_chunk_cleans_up_and_cancels(self, processor, temp_dir):
+        """A failed chunk removes every chunk file and skips pending requests."""
+        audio_file = temp_dir / 'audio' / 'long.wav'
+        processor.chunker.chunk_audio.return_value = self._chunk_files(temp_dir, 5)
+        
+        def transcribe(chunk):
+            if chunk.endswith('chunk_0.wav'):
+                raise RuntimeError("API error")
+            time.sleep(0.05)
+            return {'text': chunk, 'segments': []}
+        processor.transcriber.transcribe.side_effect = transcribe
+        
+        result = processor._process_file(str(audio_file), _file_info(audio_file))
+        
+        assert not result.success
+        assert processor.transcriber.transcribe.call_count < 5
+        assert not list(temp_dir.glob('chunk_*.wav'))
+    
+    def test_listed_chunks_removed_when_transcription_never_runs(self, processor, temp_dir):
+        """Chunks returned as a list are removed even if an earlier step failed."""
+        audio_file = temp_dir / 'audio' / 'long.wav'
+        processor.chunker.chunk_audio.return_value = list(self._chunk_files(temp_dir, 2))
+        processor.config['diarization']['enabled'] = True
+        processor.diarizer.diarize.side_effect = RuntimeError("diarization failed")
+        
+        result = processor._process_file(str(audio_file), _file_info(audio_file))
+        
+        assert not result.success
+        processor.transcriber.transcribe.assert_not_called()
+        assert not list(temp_dir.glob('chunk_*.wav'))
+
+
+def _wait_for(condition, timeout=5.0):
+    """Poll condition until it is true or timeout seconds have passed."""
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return condition()
+
+
+class TestRetryScheduling:
+    """Test the retry scheduler."""
+    
+    def _fake_process(self, processor, outcomes, log):
+        """Replace _process_file with one that records the files it is given."""
+        from src.audio.processor import ProcessingResult
+        
+        def process_file(file_path, file_info=None):
+            time.sleep(0.02)
+            result = ProcessingResult(file_path)
+            result.success = outcomes(file_path)
+            log.append(file_path)
+            return result
+            
+        processor._process_file = process_file
+        processor.file_manager.get_file_info.side_effect = lambda path: {'path': path}
+        
+    def test_retry_takes_a_worker_slot(self, processor):
+        """Queued files wait while a retry is using the only worker."""
+        log = []
+        started = threading.Event()
+        self._fake_process(processor, lambda path: True, log)
+        process_file = processor._process_file
+        
+        def slow_process_file(file_path, file_info=None):
+            started.set()
+            time.sleep(0.2)
+            return process_file(file_path, file_info)
+        processor._process_file = slow_process_file
+        processor.start()
+        
+        processor._schedule_retry('retry.wav', 1)
+        assert started.wait(2)
+        processor.add_files(['new_1.wav', 'new_2.wav'])
+        time.sleep(0.05)
+        
+        assert processor.get_queue_size() == 2
+        assert _wait_for(lambda: len(log) == 3)
+        
+    def test_retries_run_in_due_order(self, processor):
+        """A retry that is due sooner runs before one scheduled earlier."""
+        log = []
+        self._fake_process(processor, lambda path: True, log)
+        processor.start()
+        
+        processor.processing_config['retry_delay'] = 0.3
+        processor._schedule_retry('later.wav', 1)
+        processor.processing_config['retry_delay'] = 0
+        processor._schedule_retry('sooner.wav', 1)
+        
+        assert _wait_for(lambda: len(log) == 2)
+        assert log == ['sooner.wav', 'later.wav']
+        
+    def test_max_retries_moves_to_failed(self, processor):
+        """A file that keeps failing is retried max_retries times, then moved aside."""
+        log = []
+        self._fake_process(processor, lambda path: False, log)
+        processor._move_to_failed = Mock()
+        processor.start()
+        
+        processor.add_files(['broken.wav'])
+        
+        assert _wait_for(lambda: processor._move_to_failed.called)
+        assert log == ['broken.wav'] * 3
+        assert processor.get_stats()['retried'] == 2
+        processor._move_to_failed.assert_called_once_with('broken.wav')
+        
+    def test_failed_submit_releases_worker_slot(self, processor):
+        """A retry the pool refuses gives its worker slot back."""
+        log = []
+        self._fake_process(processor, lambda path: True, log)
+        processor.start()
+        executor = processor._executor
+        processor._executor = Mock()
+        processor._executor.submit.side_effect = RuntimeError("cannot schedule new futures after shutdown")
+        
+        processor._schedule_retry('retry.wav', 1)
+        assert _wait_for(lambda: processor._executor.submit.called)
+        time.sleep(0.05)
+        
+        assert processor._worker_slots.acquire(timeout=0.5)
+        processor._worker_slots.release()
+        processor._executor = executor
+
+
+class TestFileWatcherHandOff:
+    """Test the processor handing files back to the file watcher."""
+    
+    def test_same_name_file_queued_after_processing(self, processor, temp_dir):
+        """A new file with the name of one already processed is queued again."""
+        watcher_config = {'file_extensions': ['.wav'], 'debounce_seconds': 0}
+        watcher = FileWatcher(str(temp_dir / 'audio'), processor, watcher_config)
+        watcher._handler = AudioFileHandler(watcher.queue_manager, watcher_config)
+        processor.transcriber.transcribe.return_value = {'text': 'hello', 'segments': []}
+        
+        audio_file = temp_dir / 'audio' / 'meeting.wav'
+        audio_file.write_bytes(b'\0' * 1024)
+        watcher._handler.on_closed(FileClosedEvent(str(audio_file)))
+        assert watcher.queue_manager.get_next_files(1, timeout=0) == [str(audio_file)]
+        
+        result = processor._process_file(str(audio_file), _file_info(audio_file, size=1024))
+        assert result.success
+        
+        # A new recording with the same name lands after the first is archived
+        audio_file.write_bytes(b'\0' * 2048)
+        watcher._handler.on_closed(FileClosedEvent(str(audio_file)))
+        
+        assert watcher.queue_manager.get_queue_size() == 1
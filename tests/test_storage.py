@@ -0,0 +1,82 @@
+"""
+Tests for storage modules.
+"""
+
+import errno
+import os
+import pytest
+from unittest.mock import patch
+
+from src.storage.file_manager import FileManager
+
+
+@pytest.fixture
+def file_manager(temp_dir):
+    """Create a file manager using a temporary folder."""
+    return FileManager({'paths': {'temp_folder': str(temp_dir / 'temp')}})
+
+
+class TestFileManager:
+    """Test FileManager file operations."""
+    
+    @pytest.mark.skipif(not hasattr(os, 'copy_file_range'), reason="copy_file_range not available")
+    def test_copy_finishes_short_kernel_copy(self, file_manager, temp_dir):
+        """A kernel copy that stops early is finished by the next method."""
+        data = os.urandom(256 * 1024)
+        source = temp_dir / 'source.wav'
+        source.write_bytes(data)
+        real_copy_file_range = os.copy_file_range
+        
+        def short_copy_file_range(src_fd, dst_fd, count, *args):
+            # Copy the first 4 KiB, then report end of file
+            if os.lseek(src_fd, 0, os.SEEK_CUR) >= 4096:
+                return 0
+            return real_copy_file_range(src_fd, dst_fd, min(count, 4096))
+        
+        with patch('os.copy_file_range', short_copy_file_range), \
+                patch('os.sendfile', side_effect=OSError(errno.ENOSYS, 'no sendfile')):
+            copied = file_manager.copy_file_safely(source, temp_dir / 'copy.wav')
+        
+        assert copied.read_bytes() == data
+    
+    def test_copy_unsupported_kernel_copy(self, file_manager, temp_dir):
+        """Files are copied in user space when no kernel copy is supported."""
+        data = os.urandom(64 * 1024)
+        source = temp_dir / 'source.wav'
+        source.write_bytes(data)
+        unsupported = OSError(errno.EXDEV, 'cross-device')
+        
+        with patch('os.copy_file_range', side_effect=unsupported, create=True), \
+                patch('os.sendfile', side_effect=unsupported):
+            copied = file_manager.copy_file_safely(source, temp_dir / 'copy.wav')
+        
+        assert copied.read_bytes() == data
+    
+    def test_copy_does_not_overwrite(self, file_manager, temp_dir):
+        """An existing destination is kept and the copy gets a new name."""
+        source = temp_dir / 'source.wav'
+        source.write_bytes(b'new')
+        existing = temp_dir / 'copy.wav'
+        existing.write_bytes(b'old')
+        
+        copied = file_manager.copy_file_safely(source, existing)
+        
+        assert copied != existing
+        assert existing.read_bytes() == b'old'
+        assert copied.read_bytes() == b'new'
+    
+    @pytest.mark.parametrize('operation', ['copy_file_safely', 'move_file_safely', 'write_file'])
+    def test_recreates_deleted_directory(self, file_manager, temp_dir, operation):
+        """A directory deleted while still cached as existing is recreated."""
+        source = temp_dir / 'source.wav'
+        source.write_bytes(b'audio')
+        target_dir = temp_dir / 'archive'
+        file_manager.ensure_directory(target_dir)
+        target_dir.rmdir()
+        
+        if operation == 'write_file':
+            file_manager.write_file(target_dir / 'source.wav', b'audio', mode='wb')
+        else:
+            getattr(file_manager, operation)(source, target_dir / 'source.wav')
+            
+        assert (target_dir / 'source.wav').read_bytes() == b'audio'
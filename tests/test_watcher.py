@@ -0,0 +1,128 @@
+"""
+Tests for the file watcher event handling.
+"""
+
+import pytest
+from unittest.mock import Mock
+
+from watchdog.events import FileClosedEvent, FileCreatedEvent, FileMovedEvent
+
+from src.watcher.event_handler import AudioFileHandler
+from src.watcher.queue_manager import QueueManager
+
+
+@pytest.fixture
+def close_event_handler():
+    """Create a handler that behaves as it does on native inotify."""
+    handler = AudioFileHandler(Mock(), {
+        'file_extensions': ['.wav'], 'debounce_seconds': 0, 'created_settle_seconds': 0
+    })
+    handler._close_events = True
+    return handler
+
+
+class TestAudioFileHandler:
+    """Test AudioFileHandler event handling."""
+    
+    def test_moved_in_file_is_queued(self, close_event_handler, temp_dir):
+        """A file moved in from outside arrives as a create with no close event."""
+        audio_file = temp_dir / 'meeting.wav'
+        audio_file.write_bytes(b'\0' * 1024)
+        
+        close_event_handler.on_created(FileCreatedEvent(str(audio_file)))
+        close_event_handler.check_pending_creates()
+        close_event_handler.check_pending_creates()
+        
+        close_event_handler.queue_manager.add_file.assert_called_once()
+        assert close_event_handler.queue_manager.add_file.call_args[0][0] == str(audio_file)
+        assert not close_event_handler._pending_creates
+    
+    def test_growing_file_waits(self, close_event_handler, temp_dir):
+        """A created file is not queued while its size is still changing."""
+        audio_file = temp_dir / 'meeting.wav'
+        audio_file.write_bytes(b'\0' * 1024)
+        
+        close_event_handler.on_created(FileCreatedEvent(str(audio_file)))
+        close_event_handler.check_pending_creates()
+        audio_file.write_bytes(b'\0' * 2048)
+        close_event_handler.check_pending_creates()
+        
+        close_event_handler.queue_manager.add_file.assert_not_called()
+        assert str(audio_file) in close_event_handler._pending_creates
+    
+    def test_paused_writer_waits_for_settle_time(self, close_event_handler, temp_dir):
+        """A created file that stops growing is not queued before the settle time."""
+        audio_file = temp_dir / 'meeting.wav'
+        audio_file.write_bytes(b'\0' * 1024)
+        close_event_handler._created_settle_seconds = 10.0
+        
+        close_event_handler.on_created(FileCreatedEvent(str(audio_file)))
+        close_event_handler.check_pending_creates()
+        close_event_handler.check_pending_creates()
+        
+        close_event_handler.queue_manager.add_file.assert_not_called()
+        assert str(audio_file) in close_event_handler._pending_creates
+        
+        # The writer finishes and closes the file before the settle time
+        close_event_handler.on_closed(FileClosedEvent(str(audio_file)))
+        
+        close_event_handler.queue_manager.add_file.assert_called_once()
+        assert not close_event_handler._pending_creates
+    
+    def test_close_event_queues_created_file(self, close_event_handler, temp_dir):
+        """A close-after-write queues the file and ends the pending check."""
+        audio_file = temp_dir / 'meeting.wav'
+        audio_file.write_bytes(b'\0' * 1024)
+        
+        close_event_handler.on_created(FileCreatedEvent(str(audio_file)))
+        close_event_handler.on_closed(FileClosedEvent(str(audio_file)))
+        close_event_handler.check_pending_creates()
+        
+        close_event_handler.queue_manager.add_file.assert_called_once()
+        assert not close_event_handler._pending_creates
+    
+    def test_renamed_file_is_queued(self, close_event_handler, temp_dir):
+        """A rename inside the watch folder is queued straight away."""
+        audio_file = temp_dir / 'meeting.wav'
+        audio_file.write_bytes(b'\0' * 1024)
+        
+        close_event_handler.on_moved(FileMovedEvent(str(temp_dir / 'meeting.part'), str(audio_file)))
+        
+        close_event_handler.queue_manager.add_file.assert_called_once()
+    
+    def test_ignored_file_not_tracked(self, close_event_handler, temp_dir):
+        """Non-audio and ignored names are never tracked as pending."""
+        for name in ('notes.txt', '.hidden.wav'):
+            (temp_dir / name).write_bytes(b'\0')
+            close_event_handler.on_created(FileCreatedEvent(str(temp_dir / name)))
+        
+        assert not close_event_handler._pending_creates
+    
+    def test_deleted_file_dropped(self, close_event_handler, temp_dir):
+        """A created file that disappears before settling is forgotten."""
+        audio_file = temp_dir / 'meeting.wav'
+        audio_file.write_bytes(b'\0' * 1024)
+        
+        close_event_handler.on_created(FileCreatedEvent(str(audio_file)))
+        audio_file.unlink()
+        close_event_handler.check_pending_creates()
+        
+        assert not close_event_handler._pending_creates
+        close_event_handler.queue_manager.add_file.assert_not_called()
+    
+    def test_unlock_requeues_file(self, close_event_handler, temp_dir):
+        """An unlock marker puts a file that was already taken back on the queue."""
+        queue_manager = QueueManager()
+        close_event_handler.queue_manager = queue_manager
+        audio_file = temp_dir / 'meeting.wav'
+        audio_file.write_bytes(b'\0' * 1024)
+        close_event_handler.on_closed(FileClosedEvent(str(audio_file)))
+        assert queue_manager.get_next_files(1, timeout=0) == [str(audio_file)]
+        
+        marker = temp_dir / 'meeting.wav.unlock'
+        marker.write_bytes(b'')
+        close_event_handler.on_created(FileCreatedEvent(str(marker)))
+        
+        assert not marker.exists()
+        assert queue_manager.get_queue_size() == 1
+        assert queue_manager.get_next_files(1, timeout=0) == [str(audio_file)]